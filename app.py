@@ -1,38 +1,75 @@
 """Web interface for Drone Operations Agent."""
-from flask import Flask, render_template, request, jsonify
-import os
-import sys
-from pathlib import Path
+import atexit
+import inspect
+import json
+import logging
+from functools import wraps
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from flask import Flask, Response, render_template, request, jsonify, stream_with_context
+from src.agent import DroneOperationsAgent
+from src.config import CONFIG
 
-from agent import DroneOperationsAgent
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
 app = Flask(__name__)
 app.config['JSON_SORT_KEYS'] = False
 
+# Serialize API responses with orjson when it is installed
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+
+    class ORJSONProvider(DefaultJSONProvider):
+        """JSON provider backed by orjson."""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=self.default).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+except ImportError:
+    pass
+
 # Initialize agent with optional Google Sheets support
 try:
     # Agent automatically reads Google Sheets IDs from environment variables
     # Falls back to CSV if no IDs are configured
     agent = DroneOperationsAgent(csv_path="./sample-data")
+    # Write any Sheets updates still waiting on the flush timer before exit
+    atexit.register(agent.db.flush_pending_updates)
     print("OK: Agent initialized successfully!")
 except Exception as e:
     print(f"ERROR: Error initializing agent: {e}")
     agent = None
 
+def require_agent(f):
+    """Reject API requests with a 500 when the agent failed to initialize."""
+    if inspect.iscoroutinefunction(f):
+        @wraps(f)
+        async def async_wrapper(*args, **kwargs):
+            if agent is None:
+                return jsonify({"error": "Agent not initialized"}), 500
+            return await f(*args, **kwargs)
+        return async_wrapper
+    
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        if agent is None:
+            return jsonify({"error": "Agent not initialized"}), 500
+        return f(*args, **kwargs)
+    return wrapper
+
 @app.route('/')
 def index():
     """Render the main chat interface."""
     return render_template('index.html')
 
 @app.route('/api/chat', methods=['POST'])
-def chat():
+@require_agent
+async def chat():
     """Handle chat messages."""
-    if not agent:
-        return jsonify({"error": "Agent not initialized"}), 500
-    
     data = request.json
     user_message = data.get('message', '').strip()
     
@@ -40,7 +77,7 @@ def chat():
         return jsonify({"error": "Empty message"}), 400
     
     try:
-        response = agent.process_query(user_message)
+        response = await agent.process_query_async(user_message)
         return jsonify({
             "success": True,
             "message": response
@@ -51,43 +88,55 @@ def chat():
             "error": str(e)
         }), 500
 
+@app.route('/api/chat/stream', methods=['POST'])
+@require_agent
+def chat_stream():
+    """Handle chat messages, streaming the response as server-sent events."""
+    data = request.json
+    user_message = data.get('message', '').strip()
+    
+    if not user_message:
+        return jsonify({"error": "Empty message"}), 400
+    
+    def generate():
+        try:
+            for delta in agent.stream_query(user_message):
+                yield f"data: {json.dumps({'delta': delta})}\n\n"
+            yield f"data: {json.dumps({'done': True})}\n\n"
+        except Exception as e:
+            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream')
+
 @app.route('/api/status', methods=['GET'])
+@require_agent
 def status():
     """Get agent status and database summary."""
-    if not agent:
-        return jsonify({"error": "Agent not initialized"}), 500
-    
     return jsonify({
         "status": "ready",
         "summary": agent.get_database_summary()
     })
 
 @app.route('/api/help', methods=['GET'])
+@require_agent
 def help_text():
     """Get help text."""
-    if not agent:
-        return jsonify({"error": "Agent not initialized"}), 500
-    
     return jsonify({
         "help": agent._get_help_text()
     })
 
 @app.route('/api/history', methods=['GET'])
+@require_agent
 def conversation_history():
     """Get conversation history."""
-    if not agent:
-        return jsonify({"error": "Agent not initialized"}), 500
-    
     return jsonify({
-        "history": agent.conversation_history
+        "history": list(agent.conversation_history)
     })
 
 @app.route('/api/sheets/status', methods=['GET'])
+@require_agent
 def sheets_status():
     """Get Google Sheets sync status."""
-    if not agent:
-        return jsonify({"error": "Agent not initialized"}), 500
-    
     return jsonify({
         "use_google_sheets": agent.db.use_google_sheets,
         "spreadsheet_id": agent.db.spreadsheet_id or None,
@@ -95,11 +144,9 @@ def sheets_status():
     })
 
 @app.route('/api/sheets/sync', methods=['POST'])
+@require_agent
 def sheets_sync():
     """Sync current data to Google Sheets."""
-    if not agent:
-        return jsonify({"error": "Agent not initialized"}), 500
-    
     if not agent.db.use_google_sheets:
         return jsonify({
             "success": False,
@@ -110,7 +157,8 @@ def sheets_sync():
         success = agent.db.sync_to_google_sheets()
         return jsonify({
             "success": success,
-            "message": "Data synced to Google Sheets successfully" if success else "Failed to sync to Google Sheets"
+            "updated_rows": agent.db.last_sync_updated_rows if success else 0,
+            "message": "Data synced to Google Sheets in one batch request" if success else "Failed to sync to Google Sheets"
         })
     except Exception as e:
         return jsonify({
@@ -129,6 +177,4 @@ def server_error(error):
     return jsonify({"error": "Server error"}), 500
 
 if __name__ == '__main__':
-    port = int(os.getenv('PORT', 5000))
-    debug = os.getenv('DEBUG', 'False').lower() == 'true'
-    app.run(host='0.0.0.0', port=port, debug=debug)
+    app.run(host='0.0.0.0', port=CONFIG.port, debug=CONFIG.debug)
@@ -0,0 +1 @@
+"""Drone Operations Coordinator agent package."""
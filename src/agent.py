@@ -1,18 +1,144 @@
 """Main Drone Operations Coordinator Agent."""
-import os
-from dotenv import load_dotenv
-from typing import Dict, Any
+import asyncio
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional, Union
 import json
-from database import DroneDatabase
-from tools import DroneOperationsTools
+from .config import CONFIG
+from .database import DroneDatabase
+from .tools import DroneOperationsTools
 from datetime import datetime
 
-load_dotenv()
+# Identifier patterns, compiled once and shared by every query
+_MISSION_RE = re.compile(r'PRJ\d+', re.IGNORECASE)
+_PILOT_RE = re.compile(r'\bP\d+', re.IGNORECASE)
+_DRONE_RE = re.compile(r'\bD\d+', re.IGNORECASE)
+
+# LLM tools that modify the database and so must not run concurrently
+_MUTATING_TOOLS = frozenset({"assign_pilot_to_mission"})
+
+# Keyword classifier for rule-based dispatch. Each query is scanned once per
+# keyword and the hits are folded into a bitmask the dispatch tests against.
+_KEYWORDS = (
+    "available", "all", "pilot", "drone", "best pilot", "best drone", "for",
+    "mission", "details", "info", "list", "what", "show", "assign", "reassign",
+    "assignment", "alternative", "conflict", "detect", "status", "overview",
+    "help", "?", "project", "add", "allocate", "issue", "problem", "check",
+)
+_LOCATIONS = ("bangalore", "mumbai", "delhi", "pune")
+_LOCATION_RE = re.compile(r'\b(' + '|'.join(_LOCATIONS) + r')\b', re.IGNORECASE)
+_KW = {word: 1 << i for i, word in enumerate(_KEYWORDS)}
+
+# Queries made only of these words have a single deterministic answer in
+# rule-based mode, so they are answered locally without an LLM round-trip.
+_LOCAL_VOCABULARY = frozenset((
+    "show", "list", "what", "which", "all", "available", "pilot", "pilots",
+    "drone", "drones", "mission", "missions", "are", "is", "the", "me", "in",
+    "please", "detect", "find", "check", "for", "conflict", "conflicts",
+    "system", "status", "overview", "help", "?",
+) + _LOCATIONS)
+_TOKEN_RE = re.compile(r'[a-z0-9]+|\?')
+
+
+def _classify(query_lower: str):
+    """Return (keyword bitmask, first location) for a lowered query."""
+    flags = 0
+    for word, bit in _KW.items():
+        if word in query_lower:
+            flags |= bit
+    match = _LOCATION_RE.search(query_lower)
+    location = match.group(1).capitalize() if match else None
+    return flags, location
+
+
+# Prompt sent with every LLM query
+_SYSTEM_PROMPT_TEMPLATE = """You are a Drone Operations Coordinator AI Agent. Your role is to help with:
+1. Pilot roster management
+2. Drone inventory tracking
+3. Mission assignment coordination
+4. Conflict detection and resolution
+
+User Query: {user_query}
+
+Use the available tools to answer the user's question. Be conversational and helpful."""
+
+# Tool results started speculatively for the query being processed:
+# (tool name, mission_id) -> (db revision, Future)
+_prefetched_tools: ContextVar[Optional[dict]] = ContextVar("_prefetched_tools", default=None)
+
+# Help text is static, so it is built once at import
+_HELP_TEXT = """Drone Operations Coordinator Agent v1.0
+        
+PILOT MANAGEMENT:
+  • "Show available pilots" - List all available pilots with skills
+  • "Show all pilots" or "All pilots" - Same as above
+  • "Show available pilots in [location]" - Filter pilots by location
+    Examples: Bangalore, Mumbai, Delhi, Pune
+  • "Best pilot for [mission_id]" - Find best pilot for a mission
+    Example: "Best pilot for PRJ001"
+
+DRONE MANAGEMENT:
+  • "Show available drones" - List all available drones
+  • "Show all drones" or "All drones" - Same as above
+  • "Show available drones in [location]" - Filter drones by location
+  • "Best drone for [mission_id]" - Find best drone for a mission
+    Example: "Best drone for PRJ001"
+
+MISSION MANAGEMENT:
+  • "What missions are available?" - List all missions
+  • "Show all missions" or "List all missions" - Same as above
+  • "All missions" - Same as above
+  • "Mission details [mission_id]" - Get full mission details
+    Example: "Mission details PRJ001"
+
+ASSIGNMENTS:
+  • "Assign [pilot_id] to [mission_id]" - Assign a pilot to mission
+    Example: "Assign P001 to PRJ001"
+  • "Assign [drone_id] to [mission_id]" - Assign a drone to mission
+    Example: "Assign D001 to PRJ001"
+  • "Reassign pilot for [mission_id]" - Find alternative pilots
+    Example: "Reassign pilot for PRJ001"
+
+CONFLICT MANAGEMENT:
+  • "Detect conflicts" - Check for any scheduling or skill issues
+  • "Find conflicts" - Same as above
+  • "Check for conflicts" - Same as above
+
+SYSTEM MANAGEMENT:
+  • "Show system status" - View overall system statistics
+  • "System overview" - Same as above
+  • "Status" - Same as above
+
+EXAMPLES:
+  • "Show all pilots in Bangalore" - Pilots in Bangalore
+  • "Best pilot for PRJ002" - Recommended pilot with reasoning
+  • "Assign P003 to PRJ001" - Make assignment
+  • "Detect conflicts" - Check all conflicts
+
+REFERENCE:
+  Pilot IDs: P001, P002, P003, P004
+  Drone IDs: D001, D002, D003, D004
+  Mission IDs: PRJ001, PRJ002, PRJ003
+  Locations: Bangalore, Mumbai, Delhi, Pune
+
+Type any of the above commands to get started!
+"""
+
 
 class DroneOperationsAgent:
     """Main AI Agent for drone operations coordination."""
     
-    def __init__(self, csv_path: str = "../sample-data", google_sheets_id: str = None, 
+    # Maximum number of cached query responses
+    RESPONSE_CACHE_SIZE = 512
+    # Seconds to wait on a speculatively prefetched tool result
+    PREFETCH_TIMEOUT = 5
+    
+    def __init__(self, csv_path: Union[str, Path] = "../sample-data", google_sheets_id: str = None, 
                  pilot_sheet_id: str = None, drone_sheet_id: str = None, mission_sheet_id: str = None):
         """Initialize the agent with data from CSV files or Google Sheets.
         
@@ -24,12 +150,22 @@ class DroneOperationsAgent:
             mission_sheet_id: Separate Missions Google Sheet ID
         """
         self.db = DroneDatabase()
+        self.tools = DroneOperationsTools(self.db)
+        self.enable_parallel_tool_execution = True
+        # Bounded so long sessions don't grow memory or /api/history payloads
+        self.conversation_history = deque(maxlen=CONFIG.history_max)
+        self._response_cache: Dict[tuple, str] = {}
+        self._response_cache_lock = threading.Lock()
+        # The LLM client is created on first use (see the llm property)
+        self._llm_cached = None
+        self._llm_lock = threading.Lock()
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=4)
         
-        # Try to read Google Sheets IDs from environment variables if not provided
-        pilot_sheet_id = pilot_sheet_id or os.getenv("GOOGLE_SHEETS_PILOTS_ID")
-        drone_sheet_id = drone_sheet_id or os.getenv("GOOGLE_SHEETS_DRONES_ID")
-        mission_sheet_id = mission_sheet_id or os.getenv("GOOGLE_SHEETS_MISSIONS_ID")
-        google_sheets_id = google_sheets_id or os.getenv("GOOGLE_SHEETS_ID")
+        # Fall back to the configured Google Sheets IDs if not provided
+        pilot_sheet_id = pilot_sheet_id or CONFIG.pilot_sheet_id
+        drone_sheet_id = drone_sheet_id or CONFIG.drone_sheet_id
+        mission_sheet_id = mission_sheet_id or CONFIG.mission_sheet_id
+        google_sheets_id = google_sheets_id or CONFIG.google_sheets_id
         
         # Try to load from separate Google Sheets first (if all IDs provided)
         if pilot_sheet_id and drone_sheet_id and mission_sheet_id:
@@ -37,9 +173,6 @@ class DroneOperationsAgent:
             sheets_loaded = self.db.load_from_separate_google_sheets(pilot_sheet_id, drone_sheet_id, mission_sheet_id)
             if sheets_loaded:
                 print("OK: Agent initialized with separate Google Sheets")
-                self.tools = DroneOperationsTools(self.db)
-                self.conversation_history = []
-                self.llm = self._initialize_llm()
                 return
             else:
                 print("FALLING BACK: Could not load from Google Sheets, using CSV...")
@@ -50,32 +183,38 @@ class DroneOperationsAgent:
             sheets_loaded = self.db.load_from_google_sheets(google_sheets_id)
             if sheets_loaded:
                 print("OK: Agent initialized with Google Sheets")
-                self.tools = DroneOperationsTools(self.db)
-                self.conversation_history = []
-                self.llm = self._initialize_llm()
                 return
             else:
                 print("FALLING BACK: Could not load from Google Sheets, using CSV...")
         
         # Fallback to CSV
         print("Loading from CSV files...")
-        self.db.load_from_csv(
-            pilot_csv=f"{csv_path}/pilot_roster.csv",
-            drone_csv=f"{csv_path}/drone_fleet.csv",
-            mission_csv=f"{csv_path}/missions.csv"
-        )
-        
-        self.tools = DroneOperationsTools(self.db)
-        self.conversation_history = []
-        
-        # Try to initialize LLM
-        self.llm = self._initialize_llm()
+        base = Path(csv_path)
+        csv_files = {
+            'pilot_csv': base / "pilot_roster.csv",
+            'drone_csv': base / "drone_fleet.csv",
+            'mission_csv': base / "missions.csv"
+        }
+        if CONFIG.csv_cache_path:
+            self.db.load_from_csv_cached(**csv_files, cache_path=CONFIG.csv_cache_path)
+        else:
+            self.db.load_from_csv(**csv_files)
+    
+    @property
+    def llm(self):
+        """LLM client, initialized on first access; None when unavailable."""
+        if self._llm_cached is None:
+            with self._llm_lock:
+                if self._llm_cached is None:
+                    # False records a failed attempt so it is not retried
+                    self._llm_cached = self._initialize_llm() or False
+        return self._llm_cached or None
     
     def _initialize_llm(self):
         """Initialize the LLM (ChatGPT or Claude)."""
         try:
             from langchain_openai import ChatOpenAI
-            api_key = os.getenv("OPENAI-API")
+            api_key = CONFIG.openai_api_key
             if not api_key:
                 print("WARNING: OPENAI_API_KEY not found in .env")
                 return None
@@ -95,15 +234,49 @@ class DroneOperationsAgent:
             "content": user_query
         })
         
-        # If we have LLM, use it; otherwise use rule-based mode
-        if self.llm:
-            try:
-                response = self._process_with_llm(user_query)
-            except Exception as e:
-                print(f"LLM error: {e}")
+        # Repeat queries against unchanged data are answered from cache
+        cache_key = self._response_cache_key(user_query)
+        response = self._get_cached_response(cache_key)
+        
+        if response is None:
+            # Use the LLM for anything the rules can't answer outright
+            if not self._is_local_query(user_query) and self.llm:
+                try:
+                    response = self._process_with_llm(user_query)
+                except Exception as e:
+                    print(f"LLM error: {e}")
+                    response = self._process_rule_based(user_query)
+            else:
                 response = self._process_rule_based(user_query)
-        else:
-            response = self._process_rule_based(user_query)
+            self._cache_response(cache_key, response)
+        
+        self.conversation_history.append({
+            "role": "assistant",
+            "content": response
+        })
+        
+        return response
+    
+    async def process_query_async(self, user_query: str) -> str:
+        """Async variant of process_query for async request handlers."""
+        self.conversation_history.append({
+            "role": "user",
+            "content": user_query
+        })
+        
+        cache_key = self._response_cache_key(user_query)
+        response = self._get_cached_response(cache_key)
+        
+        if response is None:
+            if not self._is_local_query(user_query) and self.llm:
+                try:
+                    response = await self._process_with_llm_async(user_query)
+                except Exception as e:
+                    print(f"LLM error: {e}")
+                    response = self._process_rule_based(user_query)
+            else:
+                response = self._process_rule_based(user_query)
+            self._cache_response(cache_key, response)
         
         self.conversation_history.append({
             "role": "assistant",
@@ -111,74 +284,205 @@ class DroneOperationsAgent:
         })
         
         return response
+
+    def stream_query(self, user_query: str) -> Iterator[str]:
+        """Process a user query, yielding the response text as it is generated.
+        
+        LLM answers are streamed token by token; cached and rule-based
+        answers are yielded whole.
+        """
+        self.conversation_history.append({
+            "role": "user",
+            "content": user_query
+        })
+        
+        cache_key = self._response_cache_key(user_query)
+        response = self._get_cached_response(cache_key)
+        
+        if response is None:
+            if not self._is_local_query(user_query) and self.llm:
+                parts = []
+                try:
+                    for delta in self._stream_with_llm(user_query):
+                        parts.append(delta)
+                        yield delta
+                    response = "".join(parts)
+                except Exception as e:
+                    print(f"LLM error: {e}")
+                    # Only fall back if nothing has been sent to the client yet
+                    if parts:
+                        raise
+                    response = self._process_rule_based(user_query)
+                    yield response
+            else:
+                response = self._process_rule_based(user_query)
+                yield response
+            self._cache_response(cache_key, response)
+        else:
+            yield response
+        
+        self.conversation_history.append({
+            "role": "assistant",
+            "content": response
+        })
+    
+    @staticmethod
+    def _is_local_query(user_query: str) -> bool:
+        """Check if a query maps to exactly one rule-based intent.
+        
+        Such queries (help, conflicts, status, listings) gain nothing from
+        the LLM, so they skip it entirely.
+        """
+        query_lower = user_query.lower()
+        if not set(_TOKEN_RE.findall(query_lower)) <= _LOCAL_VOCABULARY:
+            return False
+        
+        flags, _ = _classify(query_lower)
+        if flags & (_KW["help"] | _KW["?"] | _KW["conflict"] | _KW["status"] | _KW["overview"]):
+            return True
+        if flags & (_KW["available"] | _KW["all"]) and flags & (_KW["pilot"] | _KW["drone"]):
+            return True
+        return bool(flags & _KW["mission"] and flags & (_KW["available"] | _KW["list"] | _KW["what"] | _KW["all"] | _KW["show"]))
+    
+    def _response_cache_key(self, user_query: str) -> tuple:
+        """Cache key for a query; includes the data revision so any change invalidates it."""
+        return (user_query.strip().lower(), self.db.revision)
+    
+    def _get_cached_response(self, key: tuple):
+        """Return a cached response and mark it most recently used, or None."""
+        with self._response_cache_lock:
+            response = self._response_cache.pop(key, None)
+            if response is not None:
+                self._response_cache[key] = response
+            return response
+    
+    def _cache_response(self, key: tuple, response: str):
+        """Store a response, evicting the least recently used entries."""
+        with self._response_cache_lock:
+            self._response_cache[key] = response
+            while len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+                del self._response_cache[next(iter(self._response_cache))]
+    
+    def _start_prefetch(self, user_query: str) -> dict:
+        """Start the tools the LLM is most likely to call for this query.
+        
+        Runs while the LLM is still generating, so a matching tool call
+        can pick up a finished result instead of doing the work then.
+        """
+        mission_id = self._extract_mission_id(user_query)
+        if not mission_id:
+            return {}
+        
+        flags, _ = _classify(user_query.lower())
+        names = []
+        if flags & (_KW["details"] | _KW["info"] | _KW["assign"] | _KW["best pilot"] | _KW["best drone"]):
+            names.append("get_mission_details")
+        if flags & _KW["best pilot"]:
+            names.append("find_best_pilot_for_mission")
+        if flags & _KW["best drone"]:
+            names.append("find_best_drone_for_mission")
+        
+        revision = self.db.revision
+        return {
+            (name, mission_id): (revision, self._prefetch_pool.submit(getattr(self.tools, name), mission_id))
+            for name in names
+        }
+    
+    def _prefetchable(self, name: str):
+        """Wrap a mission tool so it reuses a prefetched result when one is still valid."""
+        func = getattr(self.tools, name)
+        
+        def run(mission_id: str) -> str:
+            entry = (_prefetched_tools.get() or {}).get((name, mission_id))
+            # Only reuse results computed against the current data
+            if entry and entry[0] == self.db.revision:
+                try:
+                    return entry[1].result(timeout=self.PREFETCH_TIMEOUT)
+                except Exception:
+                    pass
+            return func(mission_id)
+        
+        return run
+    
+    @cached_property
+    def _llm_tools(self) -> list:
+        """Tool wrappers exposed to the LLM, built once on first use."""
+        try:
+            from langchain_core.tools import StructuredTool
+        except ImportError:
+            from langchain.tools import StructuredTool
+        
+        return [
+            StructuredTool.from_function(
+                name="find_available_pilots",
+                func=lambda location=None: self.tools.find_available_pilots(location),
+                description="Find available pilots. Optional: filter by location."
+            ),
+            StructuredTool.from_function(
+                name="find_available_drones",
+                func=lambda location=None: self.tools.find_available_drones(location),
+                description="Find available drones. Optional: filter by location."
+            ),
+            StructuredTool.from_function(
+                name="get_mission_details",
+                func=self._prefetchable("get_mission_details"),
+                description="Get detailed information about a specific mission. Pass mission_id."
+            ),
+            StructuredTool.from_function(
+                name="find_best_pilot_for_mission",
+                func=self._prefetchable("find_best_pilot_for_mission"),
+                description="Find the best pilot for a mission. Pass mission_id."
+            ),
+            StructuredTool.from_function(
+                name="find_best_drone_for_mission",
+                func=self._prefetchable("find_best_drone_for_mission"),
+                description="Find the best drone for a mission. Pass mission_id."
+            ),
+            StructuredTool.from_function(
+                name="assign_pilot_to_mission",
+                func=self.tools.assign_pilot_to_mission,
+                description="Assign a pilot to a mission. Pass pilot_id and mission_id."
+            ),
+            StructuredTool.from_function(
+                name="detect_conflicts",
+                func=self.tools.detect_conflicts,
+                description="Detect and report all conflicts in current assignments."
+            ),
+            StructuredTool.from_function(
+                name="list_all_missions",
+                func=self.tools.list_all_missions,
+                description="List all available missions."
+            )
+        ]
+    
+    @cached_property
+    def _llm_with_tools(self):
+        """The LLM with the tool schemas bound, reused across queries."""
+        return self.llm.bind_tools(self._llm_tools)
+    
+    def _build_llm_messages(self, user_query: str) -> list:
+        """Build the prompt messages for a user query."""
+        return [{
+            "role": "user",
+            "content": _SYSTEM_PROMPT_TEMPLATE.format(user_query=user_query)
+        }]
     
     def _process_with_llm(self, user_query: str) -> str:
         """Process query using the LLM with tools."""
+        prefetched = self._start_prefetch(user_query)
+        token = _prefetched_tools.set(prefetched)
         try:
-            try:
-                from langchain_core.tools import Tool
-            except ImportError:
-                from langchain.tools import Tool
+            tools_list = self._llm_tools
+            llm = self._llm_with_tools
+            messages = self._build_llm_messages(user_query)
             
-            # Create tool descriptions for the LLM
-            tools_list = [
-                Tool(
-                    name="Find Available Pilots",
-                    func=lambda location=None: self.tools.find_available_pilots(location),
-                    description="Find available pilots. Optional: filter by location."
-                ),
-                Tool(
-                    name="Find Available Drones",
-                    func=lambda location=None: self.tools.find_available_drones(location),
-                    description="Find available drones. Optional: filter by location."
-                ),
-                Tool(
-                    name="Get Mission Details",
-                    func=self.tools.get_mission_details,
-                    description="Get detailed information about a specific mission. Pass mission_id."
-                ),
-                Tool(
-                    name="Find Best Pilot for Mission",
-                    func=self.tools.find_best_pilot_for_mission,
-                    description="Find the best pilot for a mission. Pass mission_id."
-                ),
-                Tool(
-                    name="Find Best Drone for Mission",
-                    func=self.tools.find_best_drone_for_mission,
-                    description="Find the best drone for a mission. Pass mission_id."
-                ),
-                Tool(
-                    name="Assign Pilot to Mission",
-                    func=lambda pilot_id, mission_id: self.tools.assign_pilot_to_mission(pilot_id, mission_id),
-                    description="Assign a pilot to a mission. Pass pilot_id and mission_id."
-                ),
-                Tool(
-                    name="Detect Conflicts",
-                    func=lambda: self.tools.detect_conflicts(),
-                    description="Detect and report all conflicts in current assignments."
-                ),
-                Tool(
-                    name="List All Missions",
-                    func=lambda: self.tools.list_all_missions(),
-                    description="List all available missions."
-                )
-            ]
-            
-            # Call LLM with tools
-            messages = [{
-                "role": "user",
-                "content": f"""You are a Drone Operations Coordinator AI Agent. Your role is to help with:
-1. Pilot roster management
-2. Drone inventory tracking
-3. Mission assignment coordination
-4. Conflict detection and resolution
-
-User Query: {user_query}
-
-Use the available tools to answer the user's question. Be conversational and helpful."""
-            }]
+            response = llm.invoke(messages)
             
-            response = self.llm.invoke(messages)
+            # Run any requested tools and let the LLM answer with their output
+            if getattr(response, 'tool_calls', None):
+                tool_messages = asyncio.run(self._run_tool_calls(response.tool_calls, tools_list))
+                messages += [response, *tool_messages]
+                response = llm.invoke(messages)
             
             # Extract text from response
             if hasattr(response, 'content'):
@@ -188,34 +492,142 @@ Use the available tools to answer the user's question. Be conversational and hel
         
         except Exception as e:
             raise Exception(f"LLM processing failed: {str(e)}")
+        finally:
+            _prefetched_tools.reset(token)
+            # Discard speculative work the LLM never asked for
+            for _, future in prefetched.values():
+                future.cancel()
+    
+    async def _process_with_llm_async(self, user_query: str) -> str:
+        """Async variant of _process_with_llm."""
+        prefetched = self._start_prefetch(user_query)
+        token = _prefetched_tools.set(prefetched)
+        try:
+            tools_list = self._llm_tools
+            llm = self._llm_with_tools
+            messages = self._build_llm_messages(user_query)
+            
+            # The LLM client is synchronous; run it off the event loop
+            response = await asyncio.to_thread(llm.invoke, messages)
+            
+            if getattr(response, 'tool_calls', None):
+                tool_messages = await self._run_tool_calls(response.tool_calls, tools_list)
+                messages += [response, *tool_messages]
+                response = await asyncio.to_thread(llm.invoke, messages)
+            
+            if hasattr(response, 'content'):
+                return response.content
+            else:
+                return str(response)
+        
+        except Exception as e:
+            raise Exception(f"LLM processing failed: {str(e)}")
+        finally:
+            _prefetched_tools.reset(token)
+            for _, future in prefetched.values():
+                future.cancel()
+    
+    def _stream_with_llm(self, user_query: str) -> Iterator[str]:
+        """Streaming variant of _process_with_llm, yielding content deltas."""
+        prefetched = self._start_prefetch(user_query)
+        token = _prefetched_tools.set(prefetched)
+        try:
+            tools_list = self._llm_tools
+            llm = self._llm_with_tools
+            messages = self._build_llm_messages(user_query)
+            
+            # Accumulate chunks so tool calls can be read off the full message
+            full = None
+            for chunk in llm.stream(messages):
+                full = chunk if full is None else full + chunk
+                if chunk.content:
+                    yield chunk.content
+            
+            if full is not None and full.tool_calls:
+                tool_messages = asyncio.run(self._run_tool_calls(full.tool_calls, tools_list))
+                messages += [full, *tool_messages]
+                for chunk in llm.stream(messages):
+                    if chunk.content:
+                        yield chunk.content
+        
+        except Exception as e:
+            raise Exception(f"LLM processing failed: {str(e)}")
+        finally:
+            _prefetched_tools.reset(token)
+            for _, future in prefetched.values():
+                future.cancel()
+    
+    async def _run_tool_calls(self, tool_calls: list, tools_list: list) -> list:
+        """Execute the tool calls from one LLM response.
+        
+        Read-only calls run concurrently in worker threads when
+        enable_parallel_tool_execution is set, so latency is the slowest
+        call rather than the sum of all of them. Calls that modify the
+        database run one at a time so assignments never race.
+        """
+        from langchain_core.messages import ToolMessage
+        
+        tools_by_name = {tool.name: tool for tool in tools_list}
+        
+        async def run(call):
+            tool = tools_by_name.get(call["name"])
+            if tool is None:
+                return f"Unknown tool: {call['name']}"
+            return await asyncio.to_thread(tool.invoke, call.get("args", {}))
+        
+        results = []
+        batch = []
+        for call in tool_calls:
+            # Tools that change the data run alone, after the reads issued before them
+            if self.enable_parallel_tool_execution and call["name"] not in _MUTATING_TOOLS:
+                batch.append(call)
+                continue
+            if batch:
+                results.extend(await asyncio.gather(*(run(c) for c in batch), return_exceptions=True))
+                batch = []
+            try:
+                results.append(await run(call))
+            except Exception as e:
+                results.append(e)
+        if batch:
+            results.extend(await asyncio.gather(*(run(c) for c in batch), return_exceptions=True))
+        
+        return [
+            ToolMessage(
+                content=f"Error: {result}" if isinstance(result, Exception) else str(result),
+                tool_call_id=call["id"]
+            )
+            for call, result in zip(tool_calls, results)
+        ]
     
     def _process_rule_based(self, user_query: str) -> str:
         """Process query using rule-based logic (fallback mode)."""
-        import re
-        
         # Handle empty queries
         if not user_query or not user_query.strip():
             return "Please enter a query. Type 'help' to see available commands."
         
         query_lower = user_query.lower()
+        flags, location = _classify(query_lower)
+        
+        # Extract identifiers once; every branch below works from these
+        mission_id = self._extract_mission_id(user_query)
+        pilot_id = self._extract_pilot_id(user_query)
+        drone_id = self._extract_drone_id(user_query)
         
         # Pattern matching for common queries
-        if ("available" in query_lower or "all" in query_lower) and "pilot" in query_lower:
-            location = self._extract_location(user_query)
+        if flags & (_KW["available"] | _KW["all"]) and flags & _KW["pilot"]:
             result = self.tools.find_available_pilots(location=location)
             if "No available pilots" in result and location:
                 return f"ERROR: No available pilots found in {location}. Try another location or check 'List all missions' for options."
             return result
         
-        elif ("available" in query_lower or "all" in query_lower) and "drone" in query_lower:
-            location = self._extract_location(user_query)
+        elif flags & (_KW["available"] | _KW["all"]) and flags & _KW["drone"]:
             result = self.tools.find_available_drones(location=location)
             if "No available drones" in result and location:
                 return f"ERROR: No available drones found in {location}. Check maintenance status or location."
             return result
         
-        elif "best pilot" in query_lower and "for" in query_lower:
-            mission_id = self._extract_mission_id(user_query)
+        elif flags & _KW["best pilot"] and flags & _KW["for"]:
             if mission_id:
                 result = self.tools.find_best_pilot_for_mission(mission_id)
                 if "No suitable pilots" in result:
@@ -223,8 +635,7 @@ Use the available tools to answer the user's question. Be conversational and hel
                 return result
             return "ERROR: Mission ID not found. Specify mission ID (e.g., PRJ001).\n\nUsage: 'Best pilot for PRJ001'"
         
-        elif "best drone" in query_lower and "for" in query_lower:
-            mission_id = self._extract_mission_id(user_query)
+        elif flags & _KW["best drone"] and flags & _KW["for"]:
             if mission_id:
                 result = self.tools.find_best_drone_for_mission(mission_id)
                 if "No suitable drones" in result:
@@ -232,20 +643,16 @@ Use the available tools to answer the user's question. Be conversational and hel
                 return result
             return "ERROR: Mission ID not found. Specify mission ID.\n\nUsage: 'Best drone for PRJ001'"
         
-        elif "mission" in query_lower and ("details" in query_lower or "info" in query_lower):
-            mission_id = self._extract_mission_id(user_query)
+        elif flags & _KW["mission"] and flags & (_KW["details"] | _KW["info"]):
             if mission_id:
                 return self.tools.get_mission_details(mission_id)
             else:
                 return "NOTE: Mission ID not specified. List available missions first:\n'What missions are available?'\n\nThen use: 'Mission details PRJ001'"
         
-        elif "mission" in query_lower and ("available" in query_lower or "list" in query_lower or "what" in query_lower or "all" in query_lower or "show" in query_lower):
+        elif flags & _KW["mission"] and flags & (_KW["available"] | _KW["list"] | _KW["what"] | _KW["all"] | _KW["show"]):
             return self.tools.list_all_missions()
         
-        elif "assign" in query_lower and ("pilot" in query_lower or re.search(r'\bp\d+', user_query, re.IGNORECASE)):
-            pilot_id = self._extract_pilot_id(user_query)
-            mission_id = self._extract_mission_id(user_query)
-            
+        elif flags & _KW["assign"] and (flags & _KW["pilot"] or pilot_id):
             if not pilot_id and not mission_id:
                 return "ERROR: Missing both pilot ID and mission ID.\n\nUsage: 'Assign P001 to PRJ001'\n\nOr get suggestions:\n'Best pilot for PRJ001'"
             elif not pilot_id:
@@ -255,10 +662,7 @@ Use the available tools to answer the user's question. Be conversational and hel
             
             return self.tools.assign_pilot_to_mission(pilot_id, mission_id)
         
-        elif "assign" in query_lower and ("drone" in query_lower or re.search(r'\bd\d+', user_query, re.IGNORECASE)):
-            drone_id = self._extract_drone_id(user_query)
-            mission_id = self._extract_mission_id(user_query)
-            
+        elif flags & _KW["assign"] and (flags & _KW["drone"] or drone_id):
             if not drone_id and not mission_id:
                 return "ERROR: Missing both drone ID and mission ID.\n\nUsage: 'Assign D001 to PRJ001'\n\nOr get suggestions:\n'Best drone for PRJ001'"
             elif not drone_id:
@@ -268,16 +672,13 @@ Use the available tools to answer the user's question. Be conversational and hel
             
             return self.tools.assign_drone_to_mission(drone_id, mission_id)
         
-        elif "conflict" in query_lower or "detect" in query_lower and "conflict" in query_lower:
+        elif flags & _KW["conflict"]:
             return self.tools.detect_conflicts()
         
-        elif "status" in query_lower or "overview" in query_lower:
+        elif flags & (_KW["status"] | _KW["overview"]):
             return self.tools.get_system_status()
         
-        elif "alternative" in query_lower or "reassign" in query_lower:
-            mission_id = self._extract_mission_id(user_query)
-            pilot_id = self._extract_pilot_id(user_query)
-            
+        elif flags & (_KW["alternative"] | _KW["reassign"]):
             if mission_id and pilot_id:
                 return self.tools.find_alternative_pilot(pilot_id, mission_id)
             elif mission_id:
@@ -288,22 +689,22 @@ Use the available tools to answer the user's question. Be conversational and hel
             else:
                 return "ERROR: Mission ID not specified for reassignment.\n\nUsage: 'Reassign pilot for PRJ001'\n\nList missions: 'What missions are available?'"
         
-        elif "help" in query_lower or "?" in query_lower:
+        elif flags & (_KW["help"] | _KW["?"]):
             return self._get_help_text()
         
         else:
             # Suggest closest match based on keywords
             suggestions = []
-            if any(word in query_lower for word in ["pilot", "drone", "available"]):
+            if flags & (_KW["pilot"] | _KW["drone"] | _KW["available"]):
                 suggestions.append("  • 'Show available pilots' - List all available pilots")
                 suggestions.append("  • 'Show available drones' - List all available drones")
-            if any(word in query_lower for word in ["mission", "project", "assignment"]):
+            if flags & (_KW["mission"] | _KW["project"] | _KW["assignment"]):
                 suggestions.append("  • 'What missions are available?' - List all missions")
                 suggestions.append("  • 'Mission details PRJ001' - Get mission details")
-            if any(word in query_lower for word in ["assign", "add", "allocate"]):
+            if flags & (_KW["assign"] | _KW["add"] | _KW["allocate"]):
                 suggestions.append("  • 'Assign P001 to PRJ001' - Assign pilot to mission")
                 suggestions.append("  • 'Assign D001 to PRJ001' - Assign drone to mission")
-            if any(word in query_lower for word in ["conflict", "issue", "problem", "check"]):
+            if flags & (_KW["conflict"] | _KW["issue"] | _KW["problem"] | _KW["check"]):
                 suggestions.append("  • 'Detect conflicts' - Check for scheduling/skill issues")
             
             if suggestions:
@@ -311,115 +712,51 @@ Use the available tools to answer the user's question. Be conversational and hel
             else:
                 return "ERROR: I didn't understand that query.\n\nTry:\n  • 'Show available pilots'\n  • 'What missions are available?'\n  • 'Assign P001 to PRJ001'\n  • 'Detect conflicts'\n\nType 'help' for complete list of commands."
     
-    def _extract_location(self, text: str) -> str:
-        """Extract location from text."""
-        locations = ["bangalore", "mumbai", "delhi", "pune"]
-        text_lower = text.lower()
-        for loc in locations:
-            if loc in text_lower:
-                return loc.capitalize()
-        return None
-    
     def _extract_mission_id(self, text: str) -> str:
         """Extract mission ID from text."""
-        import re
-        match = re.search(r'PRJ\d+', text, re.IGNORECASE)
+        match = _MISSION_RE.search(text)
         if match:
             return match.group(0).upper()
         return None
     
     def _extract_pilot_id(self, text: str) -> str:
         """Extract pilot ID from text."""
-        import re
-        match = re.search(r'P\d+', text, re.IGNORECASE)
+        match = _PILOT_RE.search(text)
         if match:
             return match.group(0).upper()
         return None
     
     def _extract_drone_id(self, text: str) -> str:
         """Extract drone ID from text."""
-        import re
-        match = re.search(r'D\d+', text, re.IGNORECASE)
+        match = _DRONE_RE.search(text)
         if match:
             return match.group(0).upper()
         return None
     
     def _get_help_text(self) -> str:
         """Return comprehensive help text."""
-        return """Drone Operations Coordinator Agent v1.0
-        
-PILOT MANAGEMENT:
-  • "Show available pilots" - List all available pilots with skills
-  • "Show all pilots" or "All pilots" - Same as above
-  • "Show available pilots in [location]" - Filter pilots by location
-    Examples: Bangalore, Mumbai, Delhi, Pune
-  • "Best pilot for [mission_id]" - Find best pilot for a mission
-    Example: "Best pilot for PRJ001"
-
-DRONE MANAGEMENT:
-  • "Show available drones" - List all available drones
-  • "Show all drones" or "All drones" - Same as above
-  • "Show available drones in [location]" - Filter drones by location
-  • "Best drone for [mission_id]" - Find best drone for a mission
-    Example: "Best drone for PRJ001"
-
-MISSION MANAGEMENT:
-  • "What missions are available?" - List all missions
-  • "Show all missions" or "List all missions" - Same as above
-  • "All missions" - Same as above
-  • "Mission details [mission_id]" - Get full mission details
-    Example: "Mission details PRJ001"
-
-ASSIGNMENTS:
-  • "Assign [pilot_id] to [mission_id]" - Assign a pilot to mission
-    Example: "Assign P001 to PRJ001"
-  • "Assign [drone_id] to [mission_id]" - Assign a drone to mission
-    Example: "Assign D001 to PRJ001"
-  • "Reassign pilot for [mission_id]" - Find alternative pilots
-    Example: "Reassign pilot for PRJ001"
-
-CONFLICT MANAGEMENT:
-  • "Detect conflicts" - Check for any scheduling or skill issues
-  • "Find conflicts" - Same as above
-  • "Check for conflicts" - Same as above
-
-SYSTEM MANAGEMENT:
-  • "Show system status" - View overall system statistics
-  • "System overview" - Same as above
-  • "Status" - Same as above
-
-EXAMPLES:
-  • "Show all pilots in Bangalore" - Pilots in Bangalore
-  • "Best pilot for PRJ002" - Recommended pilot with reasoning
-  • "Assign P003 to PRJ001" - Make assignment
-  • "Detect conflicts" - Check all conflicts
-
-REFERENCE:
-  Pilot IDs: P001, P002, P003, P004
-  Drone IDs: D001, D002, D003, D004
-  Mission IDs: PRJ001, PRJ002, PRJ003
-  Locations: Bangalore, Mumbai, Delhi, Pune
-
-Type any of the above commands to get started!
-"""
+        return _HELP_TEXT
     
     def get_database_summary(self) -> str:
         """Get a summary of current database state."""
+        pilots = self.db.counts['pilots']
+        drones = self.db.counts['drones']
+        assigned_missions = self.db.counts['missions_assigned']
         summary = f"""
 Current Drone Operations Summary:
 
 Pilots: {len(self.db.pilots)} total
-  - Available: {len([p for p in self.db.pilots.values() if p.status == 'Available'])}
-  - Assigned: {len([p for p in self.db.pilots.values() if p.status == 'Assigned'])}
-  - On Leave: {len([p for p in self.db.pilots.values() if p.status == 'On Leave'])}
+  - Available: {pilots['Available']}
+  - Assigned: {pilots['Assigned']}
+  - On Leave: {pilots['On Leave']}
 
 Drones: {len(self.db.drones)} total
-  - Available: {len([d for d in self.db.drones.values() if d.is_available()])}
-  - In Maintenance: {len([d for d in self.db.drones.values() if d.is_in_maintenance()])}
-  - Deployed: {len([d for d in self.db.drones.values() if d.status == 'Deployed'])}
+  - Available: {drones['Available']}
+  - In Maintenance: {drones['Maintenance']}
+  - Deployed: {drones['Deployed']}
 
 Missions: {len(self.db.missions)} total
-  - Unassigned: {len([m for m in self.db.missions.values() if not m.assigned_pilot])}
-  - Assigned: {len([m for m in self.db.missions.values() if m.assigned_pilot])}
+  - Unassigned: {len(self.db.missions) - assigned_missions}
+  - Assigned: {assigned_missions}
 """
         return summary
@@ -0,0 +1,46 @@
+"""Configuration for Drone Operations, read from the environment once."""
+import os
+from dataclasses import dataclass
+from typing import Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+@dataclass(frozen=True)
+class Config:
+    """Application settings loaded from environment variables (and .env)."""
+    openai_api_key: Optional[str]
+    google_sheets_id: Optional[str]
+    pilot_sheet_id: Optional[str]
+    drone_sheet_id: Optional[str]
+    mission_sheet_id: Optional[str]
+    google_sheets_credentials: str
+    csv_cache_path: Optional[str]
+    history_max: int
+    port: int
+    debug: bool
+    
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Build a Config from the current environment."""
+        return cls(
+            # OPENAI-API is the name older .env files used
+            openai_api_key=os.getenv("OPENAI_API_KEY") or os.getenv("OPENAI-API"),
+            google_sheets_id=os.getenv("GOOGLE_SHEETS_ID"),
+            pilot_sheet_id=os.getenv("GOOGLE_SHEETS_PILOTS_ID"),
+            drone_sheet_id=os.getenv("GOOGLE_SHEETS_DRONES_ID"),
+            mission_sheet_id=os.getenv("GOOGLE_SHEETS_MISSIONS_ID"),
+            google_sheets_credentials=os.getenv("GOOGLE_SHEETS_CREDENTIALS", "credentials.json"),
+            # Set CSV_CACHE_PATH to reuse a pickle of the parsed CSV files; unset
+            # (the default) always reparses them. The cache is unpickled on
+            # load, so the path must be private to the app: anyone who can
+            # write to it can run code in the process.
+            csv_cache_path=os.getenv("CSV_CACHE_PATH") or None,
+            history_max=int(os.getenv("HISTORY_MAX", "200")),
+            port=int(os.getenv("PORT", "5000")),
+            debug=os.getenv("DEBUG", "False").lower() == "true"
+        )
+
+
+CONFIG = Config.from_env()
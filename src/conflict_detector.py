@@ -1,137 +1,192 @@
 """Conflict detection for drone operations."""
-from typing import List
-from datetime import datetime
-from models import Pilot, Drone, Mission, Conflict
+from collections import defaultdict
+from typing import Callable, Dict, List, Set, Tuple
+from .models import Pilot, Drone, Mission, Conflict, ConflictReport
 
 class ConflictDetector:
     """Detects conflicts and issues in drone operations."""
     
     def __init__(self, database):
         self.db = database
-        self.conflicts: List[Conflict] = []
     
-    def detect_all_conflicts(self) -> List[Conflict]:
-        """Detect all conflicts in current state."""
-        self.conflicts = []
+    def detect_all_conflicts(self) -> ConflictReport:
+        """Detect all conflicts in current state.
         
-        # Check for scheduling conflicts
-        for mission_id, mission in self.db.missions.items():
-            if mission.assigned_pilot:
-                self._check_double_booking(mission.assigned_pilot, mission)
-            if mission.assigned_drone:
-                self._check_drone_double_booking(mission.assigned_drone, mission)
-                self._check_maintenance_conflict(mission.assigned_drone, mission)
+        Returns:
+            The conflicts in detection order, also grouped by mission,
+            pilot and drone as they are found
+        """
+        # Each run keeps its state local, so concurrent callers sharing
+        # this detector don't interfere
+        report = ConflictReport()
+        append = report.add
+        # Keys of pairwise conflicts already reported in this pass
+        seen: Set[tuple] = set()
+        pilot_overlaps = self._find_overlaps(self.db.bookings['pilots'])
+        drone_overlaps = self._find_overlaps(self.db.bookings['drones'])
         
-        # Check for skill/cert mismatches
-        for mission_id, mission in self.db.missions.items():
-            if mission.assigned_pilot:
-                self._check_skill_mismatch(mission.assigned_pilot, mission)
-                self._check_cert_mismatch(mission.assigned_pilot, mission)
+        # One pass over missions
+        for mission in self.db.missions.values():
+            self._check_mission(mission, pilot_overlaps, drone_overlaps, seen, append)
         
-        # Check for location mismatches
-        for mission_id, mission in self.db.missions.items():
-            if mission.assigned_pilot and mission.assigned_drone:
-                self._check_location_mismatch(mission)
+        return report
+    
+    def detect_mission_conflicts(self, mission_id: str) -> List[Conflict]:
+        """Detect conflicts involving a single mission.
+        
+        Only the missions booked on the same pilot and drone are checked
+        for overlaps, so the cost does not grow with the total number of
+        missions.
+        """
+        conflicts: List[Conflict] = []
+        mission = self.db.get_mission_by_id(mission_id)
+        if not mission:
+            return conflicts
         
-        return self.conflicts
+        bookings = self.db.bookings
+        pilot_overlaps = self._find_overlaps(
+            {mission.assigned_pilot: bookings['pilots'][mission.assigned_pilot]}
+            if mission.assigned_pilot in bookings['pilots'] else {}
+        )
+        drone_overlaps = self._find_overlaps(
+            {mission.assigned_drone: bookings['drones'][mission.assigned_drone]}
+            if mission.assigned_drone in bookings['drones'] else {}
+        )
+        self._check_mission(mission, pilot_overlaps, drone_overlaps, set(), conflicts.append)
+        return conflicts
     
-    def _check_double_booking(self, pilot_id: str, mission: Mission):
-        """Check if pilot has overlapping assignments."""
-        pilot = self.db.get_pilot_by_id(pilot_id)
-        if not pilot or not pilot.current_assignment:
-            return
+    def _check_mission(self, mission: Mission, pilot_overlaps: Dict[Tuple[str, str], List[Mission]],
+                       drone_overlaps: Dict[Tuple[str, str], List[Mission]], seen: Set[tuple],
+                       append: Callable[[Conflict], None]):
+        """Run every check for one mission, resolving its pilot and drone once."""
+        pilot = self.db.pilots.get(mission.assigned_pilot) if mission.assigned_pilot else None
+        drone = self.db.drones.get(mission.assigned_drone) if mission.assigned_drone else None
+        if pilot:
+            self._check_double_booking(pilot, mission, pilot_overlaps, seen, append)
+            self._check_skill_mismatch(pilot, mission, append)
+            self._check_cert_mismatch(pilot, mission, append)
+        if drone:
+            self._check_drone_double_booking(drone, mission, drone_overlaps, seen, append)
+            self._check_maintenance_conflict(drone, mission, append)
+        if pilot and drone:
+            self._check_location_mismatch(pilot, drone, mission, append)
+    
+    def _find_overlaps(self, bookings: Dict[str, Set[str]]) -> Dict[Tuple[str, str], List[Mission]]:
+        """Find every pair of overlapping missions booked on the same pilot/drone.
         
-        # Check if pilot is assigned to another mission with overlapping dates
-        other_mission = self.db.get_mission_by_id(pilot.current_assignment)
-        if other_mission and self._dates_overlap(mission.start_date, mission.end_date, 
-                                                  other_mission.start_date, other_mission.end_date):
-            self.conflicts.append(Conflict(
+        Each resource's missions are sorted by start date and swept once,
+        keeping only the missions still running, so the cost is
+        O(n log n + overlaps) rather than comparing every pair.
+        
+        Returns:
+            (resource_id, mission_id) -> other missions overlapping it
+        """
+        overlaps = defaultdict(list)
+        for resource_id, mission_ids in bookings.items():
+            if len(mission_ids) < 2:
+                continue
+            missions = sorted(
+                (self.db.missions[m] for m in mission_ids if m in self.db.missions),
+                key=lambda m: (m.start_ts, m.end_ts)
+            )
+            active: List[Mission] = []
+            for mission in missions:
+                active = [other for other in active if other.end_ts > mission.start_ts]
+                for other in active:
+                    overlaps[resource_id, mission.project_id].append(other)
+                    overlaps[resource_id, other.project_id].append(mission)
+                active.append(mission)
+        return overlaps
+    
+    def _check_double_booking(self, pilot: Pilot, mission: Mission,
+                              overlaps: Dict[Tuple[str, str], List[Mission]], seen: Set[tuple],
+                              append: Callable[[Conflict], None]):
+        """Check if pilot has overlapping assignments."""
+        # Report every other mission of this pilot with overlapping dates,
+        # once per pair
+        for other_mission in overlaps.get((pilot.pilot_id, mission.project_id), ()):
+            key = ("double-booking", frozenset((mission.project_id, other_mission.project_id)), pilot.pilot_id)
+            if key in seen:
+                continue
+            seen.add(key)
+            append(Conflict(
                 conflict_type="double-booking",
                 severity="critical",
-                description=f"Pilot {pilot.name} is assigned to overlapping projects: {mission.project_id} and {other_mission.project_id}",
-                affected_pilot=pilot_id,
-                affected_mission=mission.project_id
+                description_template="Pilot {} is assigned to overlapping projects: {} and {}",
+                description_args=(pilot.name, mission.project_id, other_mission.project_id),
+                affected_pilot=pilot.pilot_id,
+                affected_mission=mission.project_id,
+                related_mission=other_mission.project_id
             ))
     
-    def _check_drone_double_booking(self, drone_id: str, mission: Mission):
+    def _check_drone_double_booking(self, drone: Drone, mission: Mission,
+                                    overlaps: Dict[Tuple[str, str], List[Mission]], seen: Set[tuple],
+                                    append: Callable[[Conflict], None]):
         """Check if drone has overlapping assignments."""
-        drone = self.db.get_drone_by_id(drone_id)
-        if not drone or not drone.current_assignment:
-            return
-        
-        other_mission = self.db.get_mission_by_id(drone.current_assignment)
-        if other_mission and self._dates_overlap(mission.start_date, mission.end_date,
-                                                  other_mission.start_date, other_mission.end_date):
-            self.conflicts.append(Conflict(
+        for other_mission in overlaps.get((drone.drone_id, mission.project_id), ()):
+            key = ("double-booking", frozenset((mission.project_id, other_mission.project_id)), drone.drone_id)
+            if key in seen:
+                continue
+            seen.add(key)
+            append(Conflict(
                 conflict_type="double-booking",
                 severity="critical",
-                description=f"Drone {drone.model} is assigned to overlapping projects: {mission.project_id} and {other_mission.project_id}",
-                affected_drone=drone_id,
-                affected_mission=mission.project_id
+                description_template="Drone {} is assigned to overlapping projects: {} and {}",
+                description_args=(drone.model, mission.project_id, other_mission.project_id),
+                affected_drone=drone.drone_id,
+                affected_mission=mission.project_id,
+                related_mission=other_mission.project_id
             ))
     
-    def _check_maintenance_conflict(self, drone_id: str, mission: Mission):
+    def _check_maintenance_conflict(self, drone: Drone, mission: Mission, append: Callable[[Conflict], None]):
         """Check if drone is in maintenance."""
-        drone = self.db.get_drone_by_id(drone_id)
-        if not drone or not drone.is_in_maintenance():
+        if not drone.is_in_maintenance():
             return
         
-        self.conflicts.append(Conflict(
+        append(Conflict(
             conflict_type="maintenance-conflict",
             severity="critical",
-            description=f"Drone {drone.model} assigned to {mission.project_id} but is currently in maintenance",
-            affected_drone=drone_id,
+            description_template="Drone {} assigned to {} but is currently in maintenance",
+            description_args=(drone.model, mission.project_id),
+            affected_drone=drone.drone_id,
             affected_mission=mission.project_id
         ))
     
-    def _check_skill_mismatch(self, pilot_id: str, mission: Mission):
+    def _check_skill_mismatch(self, pilot: Pilot, mission: Mission, append: Callable[[Conflict], None]):
         """Check if pilot has required skills."""
-        pilot = self.db.get_pilot_by_id(pilot_id)
-        if not pilot:
-            return
-        
-        missing_skills = [s for s in mission.required_skills if s not in pilot.skills]
+        missing_skills = mission.required_skills - pilot.skills
         if missing_skills:
-            self.conflicts.append(Conflict(
+            append(Conflict(
                 conflict_type="skill-mismatch",
                 severity="major",
-                description=f"Pilot {pilot.name} lacks required skills for {mission.project_id}: {', '.join(missing_skills)}",
-                affected_pilot=pilot_id,
+                description_template="Pilot {} lacks required skills for {}: {}",
+                description_args=(pilot.name, mission.project_id, missing_skills),
+                affected_pilot=pilot.pilot_id,
                 affected_mission=mission.project_id
             ))
     
-    def _check_cert_mismatch(self, pilot_id: str, mission: Mission):
+    def _check_cert_mismatch(self, pilot: Pilot, mission: Mission, append: Callable[[Conflict], None]):
         """Check if pilot has required certifications."""
-        pilot = self.db.get_pilot_by_id(pilot_id)
-        if not pilot:
-            return
-        
-        missing_certs = [c for c in mission.required_certs if c not in pilot.certifications]
+        missing_certs = mission.required_certs - pilot.certifications
         if missing_certs:
-            self.conflicts.append(Conflict(
+            append(Conflict(
                 conflict_type="skill-mismatch",
                 severity="critical",
-                description=f"Pilot {pilot.name} lacks required certifications for {mission.project_id}: {', '.join(missing_certs)}",
-                affected_pilot=pilot_id,
+                description_template="Pilot {} lacks required certifications for {}: {}",
+                description_args=(pilot.name, mission.project_id, missing_certs),
+                affected_pilot=pilot.pilot_id,
                 affected_mission=mission.project_id
             ))
     
-    def _check_location_mismatch(self, mission: Mission):
+    def _check_location_mismatch(self, pilot: Pilot, drone: Drone, mission: Mission, append: Callable[[Conflict], None]):
         """Check if pilot and drone are in same location."""
-        pilot = self.db.get_pilot_by_id(mission.assigned_pilot)
-        drone = self.db.get_drone_by_id(mission.assigned_drone)
-        
-        if pilot and drone and pilot.location != drone.location:
-            self.conflicts.append(Conflict(
+        if pilot.location != drone.location:
+            append(Conflict(
                 conflict_type="location-mismatch",
                 severity="major",
-                description=f"Pilot {pilot.name} (in {pilot.location}) and drone {drone.model} (in {drone.location}) are in different locations for {mission.project_id}",
+                description_template="Pilot {} (in {}) and drone {} (in {}) are in different locations for {}",
+                description_args=(pilot.name, pilot.location, drone.model, drone.location, mission.project_id),
                 affected_pilot=mission.assigned_pilot,
                 affected_drone=mission.assigned_drone,
                 affected_mission=mission.project_id
             ))
-    
-    @staticmethod
-    def _dates_overlap(start1: datetime, end1: datetime, start2: datetime, end2: datetime) -> bool:
-        """Check if two date ranges overlap."""
-        return start1 < end2 and start2 < end1
@@ -1,214 +1,422 @@
 """Data loading and management for Drone Operations."""
 import csv
+import io
+import json
+import logging
+import mmap
+import multiprocessing
 import os
-from datetime import datetime
-from typing import List, Dict, Optional
-from models import Pilot, Drone, Mission
+import pickle
+import re
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
+from typing import FrozenSet, Iterable, Iterator, List, Dict, Optional, Sequence, Set, Union
+from .config import CONFIG
+from .models import Pilot, Drone, Mission, join_sorted
+
+logger = logging.getLogger(__name__)
+
+
+def _with_backoff(request, retries: int = 5, base_delay: float = 1.0):
+    """Run a Sheets API request, retrying with exponential backoff on 429 (RATE_LIMIT_EXCEEDED)."""
+    for attempt in range(retries):
+        try:
+            return request()
+        except Exception as e:
+            status = getattr(getattr(e, 'response', None), 'status_code', None)
+            if status != 429 or attempt == retries - 1:
+                raise
+            delay = base_delay * 2 ** attempt
+            logger.warning("Sheets rate limit hit; retrying in %.1fs", delay)
+            time.sleep(delay)
+
+
+# Splits a comma-separated cell, dropping whitespace around each comma
+_SPLIT = re.compile(r'\s*,\s*').split
+
+
+# Skill lists and dates repeat across rows, so each distinct value is parsed
+# once per process and the resulting (immutable) objects are shared; list
+# items are interned so equal tokens from different cells share one string,
+# and equal sets written in a different order share one frozenset
+_LIST_POOL: Dict[FrozenSet[str], FrozenSet[str]] = {}
+
+
+@lru_cache(maxsize=4096)
+def _parse_list(value: str) -> FrozenSet[str]:
+    """Parse a comma-separated cell into a frozenset of stripped items."""
+    items = frozenset(map(sys.intern, _SPLIT(value.strip())))
+    return _LIST_POOL.setdefault(items, items)
+
+
+# Day zero of Google Sheets serial date numbers
+_SHEETS_EPOCH = datetime(1899, 12, 30)
+
+# Bump when the pickled model layout changes so older CSV caches are reparsed
+_CSV_CACHE_VERSION = 2
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(value: Union[str, float]) -> datetime:
+    """Parse an ISO 8601 date cell, or a Sheets serial day number."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return _SHEETS_EPOCH + timedelta(days=value)
+
+
+# CSV files at least this large are parsed in segments across processes
+PARALLEL_CSV_BYTES = 8 * 1024 * 1024
+
+
+# Columns read by the CSV loaders, in the order they are unpacked
+_PILOT_COLUMNS = ('pilot_id', 'name', 'skills', 'certifications', 'location', 'status',
+                  'current_assignment', 'available_from')
+_DRONE_COLUMNS = ('drone_id', 'model', 'capabilities', 'status', 'location',
+                  'current_assignment', 'maintenance_due')
+_MISSION_COLUMNS = ('project_id', 'client', 'location', 'required_skills', 'required_certs',
+                    'start_date', 'end_date', 'priority', 'assigned_pilot', 'assigned_drone')
+# Columns that may be missing from a file; they read as ''
+_OPTIONAL_COLUMNS = frozenset(('current_assignment', 'available_from', 'maintenance_due',
+                               'assigned_pilot', 'assigned_drone'))
+# Columns parsed with _parse_date, which also accepts Sheets serial day numbers
+_DATE_COLUMNS = frozenset(('available_from', 'maintenance_due', 'start_date', 'end_date'))
+
+
+def _column_indexes(header: List[str], columns: Sequence[str]) -> List[int]:
+    """Map column names to header positions; missing optional columns map past the end."""
+    indexes = []
+    for column in columns:
+        if column in header:
+            indexes.append(header.index(column))
+        elif column in _OPTIONAL_COLUMNS:
+            indexes.append(len(header))
+        else:
+            raise KeyError(column)
+    return indexes
+
+
+def _project_rows(rows: Iterable[List[str]], indexes: List[int]) -> Iterator[tuple]:
+    """Yield the fields at `indexes` of each non-blank row, padding short rows with ''."""
+    getter = itemgetter(*indexes)
+    width = max(indexes) + 1
+    for row in rows:
+        if not row:
+            continue
+        if len(row) < width:
+            row = row + [''] * (width - len(row))
+        yield getter(row)
+
+
+def _parse_csv_segment(path: str, start: int, end: int, indexes: List[int]) -> List[tuple]:
+    """Parse one row-aligned byte range of a CSV file (runs in a worker process)."""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = mm[start:end].decode('utf-8')
+    return list(_project_rows(csv.reader(io.StringIO(text, newline='')), indexes))
+
+
+def _csv_segment_bounds(mm: mmap.mmap, start: int, segments: int) -> List[int]:
+    """Split mm[start:] into up to `segments` byte ranges ending on row boundaries.
+    
+    A newline only ends a row if an even number of quotes precede it since
+    the last boundary, so quoted fields containing newlines are never split.
+    """
+    bounds = [start]
+    step = (len(mm) - start) // segments
+    for i in range(1, segments):
+        pos = mm.find(b'\n', max(start + i * step, bounds[-1]))
+        quotes = mm[bounds[-1]:pos].count(b'"') if pos != -1 else 0
+        while pos != -1 and quotes % 2:
+            next_pos = mm.find(b'\n', pos + 1)
+            if next_pos != -1:
+                quotes += mm[pos:next_pos].count(b'"')
+            pos = next_pos
+        if pos == -1:
+            break
+        bounds.append(pos + 1)
+    if bounds[-1] < len(mm):
+        bounds.append(len(mm))
+    return bounds
+
+
+def _read_csv_rows(filename: Union[str, Path], columns: Sequence[str],
+                   workers: Optional[int] = None) -> Iterator[tuple]:
+    """Yield the named columns of each CSV row as a tuple, in `columns` order.
+    
+    Rows are read with csv.reader and projected with itemgetter, which
+    avoids building a dict per row. Files of PARALLEL_CSV_BYTES or more
+    are memory-mapped, split on row boundaries and parsed by a process
+    pool when more than one CPU is available; otherwise the file is
+    streamed. Both paths decode the file as UTF-8.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers < 2 or os.path.getsize(filename) < PARALLEL_CSV_BYTES:
+        with open(filename, encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            indexes = _column_indexes(next(reader, []), columns)
+            yield from _project_rows(reader, indexes)
+        return
+    
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        header_end = mm.find(b'\n') + 1
+        header = next(csv.reader([mm[:header_end].decode('utf-8')]))
+        bounds = _csv_segment_bounds(mm, header_end, workers)
+    indexes = _column_indexes(header, columns)
+    
+    # The CSV loaders run in threads, so start workers from a forkserver
+    # rather than forking this multithreaded process
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context('forkserver')) as pool:
+        segments = pool.map(_parse_csv_segment, [str(filename)] * (len(bounds) - 1),
+                            bounds[:-1], bounds[1:], [indexes] * (len(bounds) - 1))
+        for segment in segments:
+            yield from segment
+
+
+def _get_sheet_values(ws) -> List[list]:
+    """Fetch every row of a worksheet, header first, in one values request.
+    
+    Cells come back unformatted and dates as serial day numbers, so the
+    response is smaller than formatted records and needs no per-row dict.
+    """
+    return ws.get_values(value_render_option='UNFORMATTED_VALUE',
+                         date_time_render_option='SERIAL_NUMBER')
+
+
+def _project_sheet_rows(values: List[list], columns: Sequence[str]) -> Iterator[tuple]:
+    """Yield the named columns of each body row of a worksheet, in `columns` order.
+    
+    Blank rows are kept (as empty fields) so row positions match the sheet.
+    Numeric and boolean cells are turned into strings like CSV fields, except
+    in date columns, which keep their serial day numbers.
+    """
+    if not values:
+        return
+    indexes = _column_indexes([str(name) for name in values[0]], columns)
+    getter = itemgetter(*indexes)
+    width = max(indexes) + 1
+    is_date = [name in _DATE_COLUMNS for name in columns]
+    for row in values[1:]:
+        if len(row) < width:
+            row = row + [''] * (width - len(row))
+        fields = getter(row)
+        yield tuple(
+            field if date or isinstance(field, str) else str(field)
+            for field, date in zip(fields, is_date)
+        )
+
+
+@lru_cache(maxsize=None)
+def _ensure_gspread():
+    """Import the Google Sheets client libraries once, on first use.
+    
+    Returns:
+        (gspread module, google.oauth2.service_account module)
+    """
+    import gspread
+    from google.oauth2 import service_account
+    return gspread, service_account
+
+
+@lru_cache(maxsize=4)
+def _get_client(creds_file: str, scope: str):
+    """Authorize a gspread client for a service account file and OAuth scope.
+    
+    Clients are shared by every load in the process, so the key file is
+    parsed and a token requested once per (file, scope); the credentials
+    refresh their token themselves when it expires.
+    """
+    gspread, service_account = _ensure_gspread()
+    creds = service_account.Credentials.from_service_account_file(creds_file, scopes=[scope])
+    return gspread.authorize(creds)
+
+
+class _AvailabilityIndex:
+    """IDs of available pilots or drones, bucketed by location, skill/capability and certification."""
+    
+    def __init__(self, order: Iterable[str] = ()):
+        # Load order, so query results match a scan of the source dict
+        self.rank = {item_id: i for i, item_id in enumerate(order)}
+        self.ids: Set[str] = set()
+        self.by_location = defaultdict(set)
+        self.by_tag = defaultdict(set)
+        self.by_cert = defaultdict(set)
+    
+    def add(self, item_id: str, location: str, tags: Iterable[str], certs: Iterable[str] = ()):
+        """Index an item that became available."""
+        self.ids.add(item_id)
+        self.by_location[location].add(item_id)
+        for tag in tags:
+            self.by_tag[tag].add(item_id)
+        for cert in certs:
+            self.by_cert[cert].add(item_id)
+    
+    def discard(self, item_id: str, location: str, tags: Iterable[str], certs: Iterable[str] = ()):
+        """Drop an item that is no longer available."""
+        self.ids.discard(item_id)
+        self.by_location[location].discard(item_id)
+        for tag in tags:
+            self.by_tag[tag].discard(item_id)
+        for cert in certs:
+            self.by_cert[cert].discard(item_id)
+    
+    def query(self, location: Optional[str] = None, tag: Optional[str] = None) -> List[str]:
+        """Return available IDs matching every given filter, in load order."""
+        # Buckets only ever hold available IDs, so a single filter reads its
+        # bucket directly and no filter reads the available set itself
+        if location and tag:
+            ids = self.by_location.get(location, set()) & self.by_tag.get(tag, set())
+        elif location:
+            ids = self.by_location.get(location, ())
+        elif tag:
+            ids = self.by_tag.get(tag, ())
+        else:
+            ids = self.ids
+        return sorted(ids, key=self.rank.__getitem__)
+    
+    def match(self, location: Optional[str] = None, tags: Iterable[str] = (),
+              certs: Iterable[str] = ()) -> List[str]:
+        """Return available IDs holding every tag and cert (and in `location`, if given), in load order."""
+        return sorted(self._matching(location, tags, certs), key=self.rank.__getitem__)
+    
+    def first_match(self, location: Optional[str] = None, tags: Iterable[str] = (),
+                    certs: Iterable[str] = ()) -> Optional[str]:
+        """Return the first ID match() would list, or None, without sorting the rest."""
+        return min(self._matching(location, tags, certs), key=self.rank.__getitem__, default=None)
+    
+    def _matching(self, location: Optional[str], tags: Iterable[str], certs: Iterable[str]) -> Set[str]:
+        """Intersect the buckets for every filter, starting from the smallest."""
+        buckets = [self.by_tag.get(tag, set()) for tag in tags]
+        buckets += [self.by_cert.get(cert, set()) for cert in certs]
+        if location:
+            buckets.append(self.by_location.get(location, set()))
+        if not buckets:
+            return self.ids
+        buckets.sort(key=len)
+        return buckets[0].intersection(*buckets[1:])
+
 
 class DroneDatabase:
     """In-memory database for drone operations."""
     
+    # Seconds to collect mission assignment changes before writing them to Sheets
+    SHEETS_FLUSH_DELAY = 2.0
+    
     def __init__(self):
         self.pilots: Dict[str, Pilot] = {}
         self.drones: Dict[str, Drone] = {}
         self.missions: Dict[str, Mission] = {}
+        # Bumped on every data change so callers can key caches on it
+        self.revision = 0
+        # Status tallies kept in step with every load and update
+        self.counts = {
+            'pilots': Counter(),
+            'drones': Counter(),
+            'missions_assigned': 0
+        }
+        # Available pilots / drones by location and skill/capability
+        self.availability = {
+            'pilots': _AvailabilityIndex(),
+            'drones': _AvailabilityIndex()
+        }
+        # Mission IDs booked on each pilot / drone, for overlap checks
+        self.bookings = {
+            'pilots': defaultdict(set),
+            'drones': defaultdict(set)
+        }
         self.use_google_sheets = False
         self.sheets_client = None
+        self.spreadsheet_id = None
+        # Open handle for spreadsheet_id, reused by every sync
+        self._spreadsheet = None
+        # Rows (header included) last read from or written to each tab
+        self._sheet_rows: Dict[str, int] = {}
+        self.last_sync_updated_rows = 0
         self.spreadsheet_ids = {
             'pilots': None,
             'drones': None,
             'missions': None
         }
+        # Sheet row number of each mission, so updates don't re-read the sheet
+        self._mission_rows: Dict[str, int] = {}
+        # Mission assignments waiting to be written: mission_id -> [pilot, drone]
+        self._pending_sheet_updates: Dict[str, list] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
     
-    def load_from_csv(self, pilot_csv: str, drone_csv: str, mission_csv: str):
+    def load_from_csv(self, pilot_csv: Union[str, Path], drone_csv: Union[str, Path], mission_csv: Union[str, Path]):
         """Load data from CSV files."""
-        self._load_pilots(pilot_csv)
-        self._load_drones(drone_csv)
-        self._load_missions(mission_csv)
+        # The loaders fill disjoint dicts, so the three files are read concurrently
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            loads = [
+                pool.submit(self._load_pilots, pilot_csv),
+                pool.submit(self._load_drones, drone_csv),
+                pool.submit(self._load_missions, mission_csv)
+            ]
+            for load in loads:
+                load.result()
+        self._recount()
+        self.revision += 1
     
-    def load_from_separate_google_sheets(self, pilot_sheet_id: str, drone_sheet_id: str, mission_sheet_id: str):
-        """Load data from 3 separate Google Sheets.
+    def load_from_csv_cached(self, pilot_csv: Union[str, Path], drone_csv: Union[str, Path],
+                             mission_csv: Union[str, Path], cache_path: Union[str, Path] = '.csv_cache.pkl'):
+        """Load data from CSV files, reusing a pickle of the last parse when they are unchanged.
         
-        Args:
-            pilot_sheet_id: Google Sheets ID for pilot roster
-            drone_sheet_id: Google Sheets ID for drone fleet
-            mission_sheet_id: Google Sheets ID for missions
+        The cache is keyed on a format version and each file's path,
+        modification time and size; any change to a CSV file makes it
+        reparse and rewrite the cache. The key is stored as a JSON header
+        line and checked before the pickled data is loaded. Unpickling can
+        still run arbitrary code, so cache_path must only be writable by
+        the app.
         """
+        paths = (pilot_csv, drone_csv, mission_csv)
+        key = [_CSV_CACHE_VERSION] + [
+            [str(path), os.stat(path).st_mtime_ns, os.stat(path).st_size] for path in paths
+        ]
         try:
-            import gspread
-            from google.oauth2 import service_account
-            
-            # Try to authenticate with service account
-            scope = ['https://www.googleapis.com/auth/spreadsheets.readonly']
-            
-            # Check for credentials file
-            creds_file = os.getenv('GOOGLE_SHEETS_CREDENTIALS', 'credentials.json')
-            if not os.path.exists(creds_file):
-                print(f"WARNING: Google Sheets credentials not found at {creds_file}")
-                print("  Falling back to CSV mode")
-                return False
-            
-            creds = service_account.Credentials.from_service_account_file(
-                creds_file, scopes=scope
-            )
-            self.sheets_client = gspread.authorize(creds)
-            
-            # Store IDs
-            self.spreadsheet_ids = {
-                'pilots': pilot_sheet_id,
-                'drones': drone_sheet_id,
-                'missions': mission_sheet_id
-            }
-            
-            # Load data from each sheet
-            self._load_pilots_from_separate_sheet(pilot_sheet_id)
-            self._load_drones_from_separate_sheet(drone_sheet_id)
-            self._load_missions_from_separate_sheet(mission_sheet_id)
-            
-            self.use_google_sheets = True
-            print("OK: Connected to Google Sheets (separate sheets)")
-            return True
-            
-        except ImportError:
-            print("WARNING: Google Sheets libraries not installed")
-            print("  Install: pip install gspread google-auth-oauthlib")
-            return False
+            with open(cache_path, 'rb') as f:
+                if json.loads(f.readline()) == key:
+                    self.pilots, self.drones, self.missions = pickle.load(f)
+                    self._recount()
+                    self.revision += 1
+                    logger.info("Loaded CSV data from cache %s", cache_path)
+                    return
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            print(f"WARNING: Could not load from Google Sheets: {e}")
-            return False
+            logger.warning("Ignoring unreadable CSV cache %s: %s", cache_path, e)
+        
+        self.load_from_csv(pilot_csv, drone_csv, mission_csv)
+        try:
+            # Write to a temporary file first so readers never see a partial cache
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(json.dumps(key).encode() + b'\n')
+                pickle.dump((self.pilots, self.drones, self.missions), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning("Could not write CSV cache %s: %s", cache_path, e)
     
-    def load_from_separate_sheets(self, pilot_sheet_id: str, drone_sheet_id: str, mission_sheet_id: str):
-        """Load data from 3 separate Google Sheets.
+    def _authorize(self, readonly: bool) -> bool:
+        """Set sheets_client to the shared client for the configured credentials file.
         
-        Args:
-            pilot_sheet_id: Google Sheets ID for pilot roster
-            drone_sheet_id: Google Sheets ID for drone fleet
-            mission_sheet_id: Google Sheets ID for missions
+        Raises ImportError if the Google Sheets libraries are missing.
         """
-        try:
-            import gspread
-            from google.oauth2 import service_account
-            
-            # Try to authenticate with service account
-            scope = ['https://www.googleapis.com/auth/spreadsheets.readonly']
-            
-            # Check for credentials file
-            creds_file = os.getenv('GOOGLE_SHEETS_CREDENTIALS', 'credentials.json')
-            if not os.path.exists(creds_file):
-                print(f"WARNING: Google Sheets credentials not found at {creds_file}")
-                print("  Falling back to CSV mode")
-                return False
-            
-            creds = service_account.Credentials.from_service_account_file(
-                creds_file, scopes=scope
-            )
-            self.sheets_client = gspread.authorize(creds)
-            
-            # Store IDs
-            self.spreadsheet_ids = {
-                'pilots': pilot_sheet_id,
-                'drones': drone_sheet_id,
-                'missions': mission_sheet_id
-            }
-            
-            # Load data from each sheet
-            self._load_pilots_from_separate_sheet(pilot_sheet_id)
-            self._load_drones_from_separate_sheet(drone_sheet_id)
-            self._load_missions_from_separate_sheet(mission_sheet_id)
-            
-            self.use_google_sheets = True
-            print("OK: Connected to Google Sheets (separate sheets)")
-            return True
-            
-        except ImportError:
-            print("WARNING: Google Sheets libraries not installed")
-            print("  Install: pip install gspread google-auth-oauthlib")
+        scope = 'https://www.googleapis.com/auth/spreadsheets' + ('.readonly' if readonly else '')
+        creds_file = CONFIG.google_sheets_credentials
+        if not os.path.exists(creds_file):
+            logger.warning("Google Sheets credentials not found at %s; falling back to CSV mode", creds_file)
             return False
-        except Exception as e:
-            print(f"WARNING: Could not load from Google Sheets: {e}")
-            return False
-    
-    def _load_pilots_from_separate_sheet(self, sheet_id: str):
-        """Load pilots from a separate Google Sheet."""
-        try:
-            sheet = self.sheets_client.open_by_key(sheet_id)
-            ws = sheet.get_worksheet(0)  # First sheet
-            records = ws.get_all_records()
-            
-            for row in records:
-                if not row.get('pilot_id'):
-                    continue
-                
-                pilot = Pilot(
-                    pilot_id=row['pilot_id'].strip(),
-                    name=row['name'].strip(),
-                    skills=[s.strip() for s in row['skills'].split(',')],
-                    certifications=[c.strip() for c in row['certifications'].split(',')],
-                    location=row['location'].strip(),
-                    status=row['status'].strip(),
-                    current_assignment=row.get('current_assignment', '').strip() or None,
-                    available_from=datetime.fromisoformat(row['available_from'].strip()) if row.get('available_from', '').strip() else None
-                )
-                self.pilots[pilot.pilot_id] = pilot
-            
-            print(f"  Loaded {len(self.pilots)} pilots from Google Sheets")
-        except Exception as e:
-            print(f"ERROR loading pilots from Google Sheets: {e}")
-    
-    def _load_drones_from_separate_sheet(self, sheet_id: str):
-        """Load drones from a separate Google Sheet."""
-        try:
-            sheet = self.sheets_client.open_by_key(sheet_id)
-            ws = sheet.get_worksheet(0)  # First sheet
-            records = ws.get_all_records()
-            
-            for row in records:
-                if not row.get('drone_id'):
-                    continue
-                
-                drone = Drone(
-                    drone_id=row['drone_id'].strip(),
-                    model=row['model'].strip(),
-                    capabilities=[c.strip() for c in row['capabilities'].split(',')],
-                    status=row['status'].strip(),
-                    location=row['location'].strip(),
-                    current_assignment=row.get('current_assignment', '').strip() or None,
-                    maintenance_due=datetime.fromisoformat(row['maintenance_due'].strip()) if row.get('maintenance_due', '').strip() else None
-                )
-                self.drones[drone.drone_id] = drone
-            
-            print(f"  Loaded {len(self.drones)} drones from Google Sheets")
-        except Exception as e:
-            print(f"ERROR loading drones from Google Sheets: {e}")
-    
-    def _load_missions_from_separate_sheet(self, sheet_id: str):
-        """Load missions from a separate Google Sheet."""
-        try:
-            sheet = self.sheets_client.open_by_key(sheet_id)
-            ws = sheet.get_worksheet(0)  # First sheet
-            records = ws.get_all_records()
-            
-            for row in records:
-                if not row.get('project_id'):
-                    continue
-                
-                mission = Mission(
-                    project_id=row['project_id'].strip(),
-                    client=row['client'].strip(),
-                    location=row['location'].strip(),
-                    required_skills=[s.strip() for s in row['required_skills'].split(',')],
-                    required_certs=[c.strip() for c in row['required_certs'].split(',')],
-                    start_date=datetime.fromisoformat(row['start_date'].strip()),
-                    end_date=datetime.fromisoformat(row['end_date'].strip()),
-                    priority=row['priority'].strip(),
-                    assigned_pilot=row.get('assigned_pilot', '').strip() or None,
-                    assigned_drone=row.get('assigned_drone', '').strip() or None
-                )
-                self.missions[mission.project_id] = mission
-            
-            print(f"  Loaded {len(self.missions)} missions from Google Sheets")
-        except Exception as e:
-            print(f"ERROR loading missions from Google Sheets: {e}")
+        
+        self.sheets_client = _get_client(creds_file, scope)
+        return True
     
     def load_from_google_sheets(self, spreadsheet_id: str):
         """Load data from Google Sheets.
@@ -217,319 +425,285 @@ class DroneDatabase:
             spreadsheet_id: The Google Sheets ID from URL
         """
         try:
-            import gspread
-            from google.oauth2 import service_account
-            
-            # Try to authenticate with service account
-            scope = ['https://www.googleapis.com/auth/spreadsheets']
-            
-            # Check for credentials file
-            creds_file = os.getenv('GOOGLE_SHEETS_CREDENTIALS', 'credentials.json')
-            if not os.path.exists(creds_file):
-                print(f"WARNING: Google Sheets credentials not found at {creds_file}")
-                print("  Falling back to CSV mode")
+            if not self._authorize(readonly=False):
                 return False
-            
-            creds = service_account.Credentials.from_service_account_file(
-                creds_file, scopes=scope
-            )
-            self.sheets_client = gspread.authorize(creds)
+            self.spreadsheet_id = spreadsheet_id
             self.spreadsheet_ids['pilots'] = spreadsheet_id
             
             # Load data from each sheet
             sheet = self.sheets_client.open_by_key(spreadsheet_id)
+            self._spreadsheet = sheet
             
             self._load_pilots_from_sheets(sheet)
             self._load_drones_from_sheets(sheet)
             self._load_missions_from_sheets(sheet)
             
             self.use_google_sheets = True
-            print("OK: Connected to Google Sheets")
+            self._recount()
+            self.revision += 1
+            logger.info("Connected to Google Sheets")
             return True
             
         except ImportError:
-            print("WARNING: Google Sheets libraries not installed")
-            print("  Install: pip install gspread google-auth-oauthlib")
+            logger.warning("Google Sheets libraries not installed "
+                           "(pip install gspread google-auth-oauthlib)")
             return False
         except Exception as e:
-            print(f"WARNING: Could not load from Google Sheets: {e}")
-            print("  Falling back to CSV mode")
+            logger.warning("Could not load from Google Sheets: %s; falling back to CSV mode", e)
             return False
     
-    def load_from_separate_google_sheets(self, pilot_sheet_id: str, drone_sheet_id: str, mission_sheet_id: str):
+    def _load_separate(self, pilot_sheet_id: str, drone_sheet_id: str, mission_sheet_id: str, readonly: bool = True):
         """Load data from 3 separate Google Sheets.
         
         Args:
             pilot_sheet_id: Spreadsheet ID for pilots
             drone_sheet_id: Spreadsheet ID for drones
             mission_sheet_id: Spreadsheet ID for missions
+            readonly: Request read-only access to the spreadsheets
         """
         try:
-            import gspread
-            from google.oauth2 import service_account
-            
-            scope = ['https://www.googleapis.com/auth/spreadsheets.readonly']
-            
-            creds_file = os.getenv('GOOGLE_SHEETS_CREDENTIALS', 'credentials.json')
-            if not os.path.exists(creds_file):
-                print(f"WARNING: Google Sheets credentials not found at {creds_file}")
-                print("  Falling back to CSV mode")
+            if not self._authorize(readonly=readonly):
                 return False
+            self.spreadsheet_ids = {
+                'pilots': pilot_sheet_id,
+                'drones': drone_sheet_id,
+                'missions': mission_sheet_id
+            }
             
-            creds = service_account.Credentials.from_service_account_file(
-                creds_file, scopes=scope
-            )
-            self.sheets_client = gspread.authorize(creds)
-            self.pilot_sheet_id = pilot_sheet_id
-            self.drone_sheet_id = drone_sheet_id
-            self.mission_sheet_id = mission_sheet_id
-            
-            # Load pilots
-            pilot_sheet = self.sheets_client.open_by_key(pilot_sheet_id)
-            self._load_pilots_from_separate_sheet(pilot_sheet)
-            
-            # Load drones
-            drone_sheet = self.sheets_client.open_by_key(drone_sheet_id)
-            self._load_drones_from_separate_sheet(drone_sheet)
-            
-            # Load missions
-            mission_sheet = self.sheets_client.open_by_key(mission_sheet_id)
-            self._load_missions_from_separate_sheet(mission_sheet)
+            # Each spreadsheet is opened and read on its own thread so the
+            # round-trips overlap; the loaders fill disjoint dicts
+            open_by_key = self.sheets_client.open_by_key
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                loads = [
+                    pool.submit(lambda: self._load_pilots_from_separate_sheet(open_by_key(pilot_sheet_id))),
+                    pool.submit(lambda: self._load_drones_from_separate_sheet(open_by_key(drone_sheet_id))),
+                    pool.submit(lambda: self._load_missions_from_separate_sheet(open_by_key(mission_sheet_id)))
+                ]
+                for load in loads:
+                    load.result()
             
             self.use_google_sheets = True
-            print("OK: Connected to separate Google Sheets")
-            print(f"  Pilots: {pilot_sheet_id[:20]}...")
-            print(f"  Drones: {drone_sheet_id[:20]}...")
-            print(f"  Missions: {mission_sheet_id[:20]}...")
+            self._recount()
+            self.revision += 1
+            logger.info("Connected to separate Google Sheets (pilots %.20s..., drones %.20s..., missions %.20s...)",
+                        pilot_sheet_id, drone_sheet_id, mission_sheet_id)
             return True
             
         except ImportError:
-            print("WARNING: Google Sheets libraries not installed")
-            print("  Install: pip install gspread google-auth-oauthlib")
+            logger.warning("Google Sheets libraries not installed "
+                           "(pip install gspread google-auth-oauthlib)")
             return False
         except Exception as e:
-            print(f"WARNING: Could not load from Google Sheets: {e}")
-            print("  Falling back to CSV mode")
+            logger.warning("Could not load from Google Sheets: %s; falling back to CSV mode", e)
             return False
     
+    load_from_separate_google_sheets = load_from_separate_sheets = _load_separate
+    
     def _load_pilots_from_separate_sheet(self, sheet):
         """Load pilots from a separate Google Sheet."""
         try:
             # Try 'Pilots' tab first, then 'Sheet1' or first available
             try:
                 ws = sheet.worksheet('Pilots')
-            except:
+            except Exception:
                 ws = sheet.sheet1
             
-            records = ws.get_all_records()
-            for row in records:
-                if not row.get('pilot_id'):
-                    continue
-                pilot = Pilot(
-                    pilot_id=row['pilot_id'],
-                    name=row['name'],
-                    skills=[s.strip() for s in row['skills'].split(',')],
-                    certifications=[c.strip() for c in row['certifications'].split(',')],
-                    location=row['location'],
-                    status=row['status'],
-                    current_assignment=row.get('current_assignment') or None,
-                    available_from=datetime.fromisoformat(row['available_from']) if row.get('available_from') else None
-                )
-                self.pilots[pilot.pilot_id] = pilot
-            print(f"  Loaded {len(self.pilots)} pilots")
-        except Exception as e:
-            print(f"ERROR loading pilots: {e}")
+            self._add_pilots(_project_sheet_rows(_get_sheet_values(ws), _PILOT_COLUMNS))
+            logger.info("Loaded %d pilots", len(self.pilots))
+        except Exception:
+            logger.exception("Could not load pilots")
     
     def _load_drones_from_separate_sheet(self, sheet):
         """Load drones from a separate Google Sheet."""
         try:
             try:
                 ws = sheet.worksheet('Drones')
-            except:
+            except Exception:
                 ws = sheet.sheet1
             
-            records = ws.get_all_records()
-            for row in records:
-                if not row.get('drone_id'):
-                    continue
-                drone = Drone(
-                    drone_id=row['drone_id'],
-                    model=row['model'],
-                    capabilities=[c.strip() for c in row['capabilities'].split(',')],
-                    status=row['status'],
-                    location=row['location'],
-                    current_assignment=row.get('current_assignment') or None,
-                    maintenance_due=datetime.fromisoformat(row['maintenance_due']) if row.get('maintenance_due') else None
-                )
-                self.drones[drone.drone_id] = drone
-            print(f"  Loaded {len(self.drones)} drones")
-        except Exception as e:
-            print(f"ERROR loading drones: {e}")
+            self._add_drones(_project_sheet_rows(_get_sheet_values(ws), _DRONE_COLUMNS))
+            logger.info("Loaded %d drones", len(self.drones))
+        except Exception:
+            logger.exception("Could not load drones")
     
     def _load_missions_from_separate_sheet(self, sheet):
         """Load missions from a separate Google Sheet."""
         try:
             try:
                 ws = sheet.worksheet('Missions')
-            except:
+            except Exception:
                 ws = sheet.sheet1
             
-            records = ws.get_all_records()
-            for row in records:
-                if not row.get('project_id'):
-                    continue
-                mission = Mission(
-                    project_id=row['project_id'],
-                    client=row['client'],
-                    location=row['location'],
-                    required_skills=[s.strip() for s in row['required_skills'].split(',')],
-                    required_certs=[c.strip() for c in row['required_certs'].split(',')],
-                    start_date=datetime.fromisoformat(row['start_date']),
-                    end_date=datetime.fromisoformat(row['end_date']),
-                    priority=row['priority'],
-                    assigned_pilot=row.get('assigned_pilot') or None,
-                    assigned_drone=row.get('assigned_drone') or None
-                )
-                self.missions[mission.project_id] = mission
-            print(f"  Loaded {len(self.missions)} missions")
-        except Exception as e:
-            print(f"ERROR loading missions: {e}")
+            self._add_missions(_project_sheet_rows(_get_sheet_values(ws), _MISSION_COLUMNS), first_row=2)
+            logger.info("Loaded %d missions", len(self.missions))
+        except Exception:
+            logger.exception("Could not load missions")
     
     def _load_pilots_from_sheets(self, sheet):
         """Load pilots from Google Sheets."""
         try:
-            ws = sheet.worksheet('Pilots')
-            records = ws.get_all_records()
-            for row in records:
-                if not row.get('pilot_id'):
-                    continue
-                pilot = Pilot(
-                    pilot_id=row['pilot_id'],
-                    name=row['name'],
-                    skills=[s.strip() for s in row['skills'].split(',')],
-                    certifications=[c.strip() for c in row['certifications'].split(',')],
-                    location=row['location'],
-                    status=row['status'],
-                    current_assignment=row.get('current_assignment') or None,
-                    available_from=datetime.fromisoformat(row['available_from']) if row.get('available_from') else None
-                )
-                self.pilots[pilot.pilot_id] = pilot
-        except Exception as e:
-            print(f"ERROR loading pilots from Google Sheets: {e}")
+            values = _get_sheet_values(sheet.worksheet('Pilots'))
+            self._sheet_rows['Pilots'] = len(values)
+            self._add_pilots(_project_sheet_rows(values, _PILOT_COLUMNS))
+        except Exception:
+            logger.exception("Could not load pilots from Google Sheets")
     
     def _load_drones_from_sheets(self, sheet):
         """Load drones from Google Sheets."""
         try:
-            ws = sheet.worksheet('Drones')
-            records = ws.get_all_records()
-            for row in records:
-                if not row.get('drone_id'):
-                    continue
-                drone = Drone(
-                    drone_id=row['drone_id'],
-                    model=row['model'],
-                    capabilities=[c.strip() for c in row['capabilities'].split(',')],
-                    status=row['status'],
-                    location=row['location'],
-                    current_assignment=row.get('current_assignment') or None,
-                    maintenance_due=datetime.fromisoformat(row['maintenance_due']) if row.get('maintenance_due') else None
-                )
-                self.drones[drone.drone_id] = drone
-        except Exception as e:
-            print(f"ERROR loading drones from Google Sheets: {e}")
+            values = _get_sheet_values(sheet.worksheet('Drones'))
+            self._sheet_rows['Drones'] = len(values)
+            self._add_drones(_project_sheet_rows(values, _DRONE_COLUMNS))
+        except Exception:
+            logger.exception("Could not load drones from Google Sheets")
     
     def _load_missions_from_sheets(self, sheet):
         """Load missions from Google Sheets."""
         try:
-            ws = sheet.worksheet('Missions')
-            records = ws.get_all_records()
-            for row in records:
-                if not row.get('project_id'):
-                    continue
-                mission = Mission(
-                    project_id=row['project_id'],
-                    client=row['client'],
-                    location=row['location'],
-                    required_skills=[s.strip() for s in row['required_skills'].split(',')],
-                    required_certs=[c.strip() for c in row['required_certs'].split(',')],
-                    start_date=datetime.fromisoformat(row['start_date']),
-                    end_date=datetime.fromisoformat(row['end_date']),
-                    priority=row['priority'],
-                    assigned_pilot=row.get('assigned_pilot') or None,
-                    assigned_drone=row.get('assigned_drone') or None
-                )
-                self.missions[mission.project_id] = mission
-        except Exception as e:
-            print(f"ERROR loading missions from Google Sheets: {e}")
+            values = _get_sheet_values(sheet.worksheet('Missions'))
+            self._sheet_rows['Missions'] = len(values)
+            self._add_missions(_project_sheet_rows(values, _MISSION_COLUMNS), first_row=2)
+        except Exception:
+            logger.exception("Could not load missions from Google Sheets")
     
-    def _load_pilots(self, filename: str):
+    def _load_pilots(self, filename: Union[str, Path]):
         """Load pilots from CSV."""
-        with open(filename) as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                pilot = Pilot(
-                    pilot_id=row['pilot_id'],
-                    name=row['name'],
-                    skills=[s.strip() for s in row['skills'].split(',')],
-                    certifications=[c.strip() for c in row['certifications'].split(',')],
-                    location=row['location'],
-                    status=row['status'],
-                    current_assignment=row.get('current_assignment', None) or None,
-                    available_from=datetime.fromisoformat(row['available_from']) if row.get('available_from') else None
-                )
-                self.pilots[pilot.pilot_id] = pilot
-    
-    def _load_drones(self, filename: str):
+        self._add_pilots(_read_csv_rows(filename, _PILOT_COLUMNS))
+    
+    def _load_drones(self, filename: Union[str, Path]):
         """Load drones from CSV."""
-        with open(filename) as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                drone = Drone(
-                    drone_id=row['drone_id'],
-                    model=row['model'],
-                    capabilities=[c.strip() for c in row['capabilities'].split(',')],
-                    status=row['status'],
-                    location=row['location'],
-                    current_assignment=row.get('current_assignment', None) or None,
-                    maintenance_due=datetime.fromisoformat(row['maintenance_due']) if row.get('maintenance_due') else None
-                )
-                self.drones[drone.drone_id] = drone
-    
-    def _load_missions(self, filename: str):
-        """Load missions from CSV."""
-        with open(filename) as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                mission = Mission(
-                    project_id=row['project_id'],
-                    client=row['client'],
-                    location=row['location'],
-                    required_skills=[s.strip() for s in row['required_skills'].split(',')],
-                    required_certs=[c.strip() for c in row['required_certs'].split(',')],
-                    start_date=datetime.fromisoformat(row['start_date']),
-                    end_date=datetime.fromisoformat(row['end_date']),
-                    priority=row['priority']
-                )
-                self.missions[mission.project_id] = mission
+        self._add_drones(_read_csv_rows(filename, _DRONE_COLUMNS))
+    
+    def _load_missions(self, filename: Union[str, Path]):
+        """Load missions from CSV.
+        
+        CSV missions always start unassigned, so any assigned_pilot and
+        assigned_drone columns in the file are not read.
+        """
+        rows = _read_csv_rows(filename, _MISSION_COLUMNS[:-2])
+        self._add_missions(row + ('', '') for row in rows)
+    
+    def _add_pilots(self, rows: Iterable[tuple]):
+        """Build pilots from rows projected to _PILOT_COLUMNS."""
+        for (pilot_id, name, skills, certifications, location, status,
+             current_assignment, available_from) in rows:
+            if not pilot_id:
+                continue
+            pilot = Pilot(
+                pilot_id=pilot_id,
+                name=name,
+                skills=_parse_list(skills),
+                certifications=_parse_list(certifications),
+                location=sys.intern(location),
+                status=sys.intern(status),
+                current_assignment=current_assignment or None,
+                available_from=_parse_date(available_from) if available_from else None
+            )
+            self.pilots[pilot.pilot_id] = pilot
+    
+    def _add_drones(self, rows: Iterable[tuple]):
+        """Build drones from rows projected to _DRONE_COLUMNS."""
+        for (drone_id, model, capabilities, status, location,
+             current_assignment, maintenance_due) in rows:
+            if not drone_id:
+                continue
+            drone = Drone(
+                drone_id=drone_id,
+                model=model,
+                capabilities=_parse_list(capabilities),
+                status=sys.intern(status),
+                location=sys.intern(location),
+                current_assignment=current_assignment or None,
+                maintenance_due=_parse_date(maintenance_due) if maintenance_due else None
+            )
+            self.drones[drone.drone_id] = drone
+    
+    def _add_missions(self, rows: Iterable[tuple], first_row: Optional[int] = None):
+        """Build missions from rows projected to _MISSION_COLUMNS.
+        
+        Args:
+            rows: Projected rows, blank rows included
+            first_row: Sheet row number of the first row, when loading from
+                Sheets; recorded per mission for in-place assignment updates
+        """
+        for row_number, (project_id, client, location, required_skills, required_certs,
+                         start_date, end_date, priority, assigned_pilot,
+                         assigned_drone) in enumerate(rows, start=first_row or 0):
+            if not project_id:
+                continue
+            if first_row:
+                self._mission_rows[project_id] = row_number
+            mission = Mission(
+                project_id=project_id,
+                client=client,
+                location=sys.intern(location),
+                required_skills=_parse_list(required_skills),
+                required_certs=_parse_list(required_certs),
+                start_date=_parse_date(start_date),
+                end_date=_parse_date(end_date),
+                priority=priority,
+                assigned_pilot=assigned_pilot or None,
+                assigned_drone=assigned_drone or None
+            )
+            self.missions[mission.project_id] = mission
+    
+    def _recount(self):
+        """Rebuild the status tallies and indexes from scratch after a bulk load."""
+        self.counts = {
+            'pilots': Counter(p.status for p in self.pilots.values()),
+            'drones': Counter(d.status for d in self.drones.values()),
+            'missions_assigned': sum(1 for m in self.missions.values() if m.assigned_pilot)
+        }
+        self.bookings = {
+            'pilots': defaultdict(set),
+            'drones': defaultdict(set)
+        }
+        for mission in self.missions.values():
+            if mission.assigned_pilot:
+                self.bookings['pilots'][mission.assigned_pilot].add(mission.project_id)
+            if mission.assigned_drone:
+                self.bookings['drones'][mission.assigned_drone].add(mission.project_id)
+        self.availability = {
+            'pilots': _AvailabilityIndex(self.pilots),
+            'drones': _AvailabilityIndex(self.drones)
+        }
+        for pilot in self.pilots.values():
+            if pilot.status == "Available":
+                self.availability['pilots'].add(pilot.pilot_id, pilot.location, pilot.skills,
+                                                pilot.certifications)
+        for drone in self.drones.values():
+            if drone.is_available():
+                self.availability['drones'].add(drone.drone_id, drone.location, drone.capabilities)
     
     # Query methods
     def get_available_pilots(self, location: Optional[str] = None, skill: Optional[str] = None) -> List[Pilot]:
         """Get all available pilots, optionally filtered."""
-        pilots = [p for p in self.pilots.values() if p.status == "Available"]
-        if location:
-            pilots = [p for p in pilots if p.location == location]
-        if skill:
-            pilots = [p for p in pilots if skill in p.skills]
-        return pilots
+        return [self.pilots[p] for p in self.availability['pilots'].query(location, skill)]
     
     def get_available_drones(self, location: Optional[str] = None, capability: Optional[str] = None) -> List[Drone]:
         """Get all available drones, optionally filtered."""
-        drones = [d for d in self.drones.values() if d.is_available()]
-        if location:
-            drones = [d for d in drones if d.location == location]
-        if capability:
-            drones = [d for d in drones if capability in d.capabilities]
-        return drones
+        return [self.drones[d] for d in self.availability['drones'].query(location, capability)]
+    
+    def get_qualified_pilots(self, skills: Iterable[str], certifications: Iterable[str],
+                             location: Optional[str] = None) -> List[Pilot]:
+        """Get available pilots holding every given skill and certification."""
+        ids = self.availability['pilots'].match(location, skills, certifications)
+        return [self.pilots[p] for p in ids]
+    
+    def get_qualified_drones(self, capabilities: Iterable[str], location: Optional[str] = None) -> List[Drone]:
+        """Get available drones with every given capability."""
+        return [self.drones[d] for d in self.availability['drones'].match(location, capabilities)]
+    
+    def find_qualified_pilot(self, skills: Iterable[str], certifications: Iterable[str],
+                             location: Optional[str] = None) -> Optional[Pilot]:
+        """Get the first pilot get_qualified_pilots would return, or None."""
+        pilot_id = self.availability['pilots'].first_match(location, skills, certifications)
+        return self.pilots[pilot_id] if pilot_id else None
+    
+    def find_qualified_drone(self, capabilities: Iterable[str], location: Optional[str] = None) -> Optional[Drone]:
+        """Get the first drone get_qualified_drones would return, or None."""
+        drone_id = self.availability['drones'].first_match(location, capabilities)
+        return self.drones[drone_id] if drone_id else None
     
     def get_pilot_by_id(self, pilot_id: str) -> Optional[Pilot]:
         """Get pilot by ID."""
@@ -546,137 +720,225 @@ class DroneDatabase:
     def update_pilot_status(self, pilot_id: str, status: str, assignment: Optional[str] = None):
         """Update pilot status and assignment."""
         if pilot_id in self.pilots:
-            self.pilots[pilot_id].status = status
-            self.pilots[pilot_id].current_assignment = assignment
+            pilot = self.pilots[pilot_id]
+            self.counts['pilots'][pilot.status] -= 1
+            self.counts['pilots'][status] += 1
+            if status == "Available":
+                self.availability['pilots'].add(pilot_id, pilot.location, pilot.skills, pilot.certifications)
+            else:
+                self.availability['pilots'].discard(pilot_id, pilot.location, pilot.skills, pilot.certifications)
+            pilot.status = status
+            pilot.current_assignment = assignment
+            self.revision += 1
     
     def update_drone_status(self, drone_id: str, status: str, assignment: Optional[str] = None):
         """Update drone status and assignment."""
         if drone_id in self.drones:
-            self.drones[drone_id].status = status
-            self.drones[drone_id].current_assignment = assignment
+            drone = self.drones[drone_id]
+            self.counts['drones'][drone.status] -= 1
+            self.counts['drones'][status] += 1
+            if status == "Available":
+                self.availability['drones'].add(drone_id, drone.location, drone.capabilities)
+            else:
+                self.availability['drones'].discard(drone_id, drone.location, drone.capabilities)
+            drone.status = status
+            drone.current_assignment = assignment
+            self.revision += 1
     
     def update_mission_assignment(self, mission_id: str, pilot_id: Optional[str], drone_id: Optional[str]):
         """Update mission assignment."""
         if mission_id in self.missions:
-            self.missions[mission_id].assigned_pilot = pilot_id
-            self.missions[mission_id].assigned_drone = drone_id
+            mission = self.missions[mission_id]
+            self.counts['missions_assigned'] += bool(pilot_id) - bool(mission.assigned_pilot)
+            self._rebook('pilots', mission_id, mission.assigned_pilot, pilot_id)
+            self._rebook('drones', mission_id, mission.assigned_drone, drone_id)
+            mission.assigned_pilot = pilot_id
+            mission.assigned_drone = drone_id
+            self.revision += 1
             
             # Sync to Google Sheets if enabled
             if self.use_google_sheets:
                 self._sync_mission_to_sheets(mission_id)
     
+    def _rebook(self, kind: str, mission_id: str, old_id: Optional[str], new_id: Optional[str]):
+        """Move a mission's booking from one pilot/drone to another."""
+        if old_id == new_id:
+            return
+        if old_id:
+            booked = self.bookings[kind].get(old_id)
+            if booked:
+                booked.discard(mission_id)
+                if not booked:
+                    del self.bookings[kind][old_id]
+        if new_id:
+            self.bookings[kind][new_id].add(mission_id)
+    
     def sync_to_google_sheets(self):
-        """Sync all current data to Google Sheets."""
-        if not self.use_google_sheets or not self.sheets_client:
+        """Sync all current data to Google Sheets.
+        
+        All three tabs are written with a single values.batchUpdate call
+        instead of separate calls per worksheet. A table that shrank is
+        padded with blank rows over its old length, so stale rows are
+        overwritten without a separate clear; only a tab whose length is
+        unknown still needs a batch clear afterwards.
+        """
+        if not self.use_google_sheets or not self.sheets_client or not self.spreadsheet_id:
             return False
         
         try:
-            sheet = self.sheets_client.open_by_key(self.spreadsheet_id)
-            self._sync_pilots_to_sheets(sheet)
-            self._sync_drones_to_sheets(sheet)
-            self._sync_missions_to_sheets(sheet)
-            print("OK: Data synced to Google Sheets")
+            sheet = self._get_spreadsheet()
+            tables = {
+                'Pilots': self._pilot_sheet_rows(),
+                'Drones': self._drone_sheet_rows(),
+                'Missions': self._mission_sheet_rows()
+            }
+            data = []
+            stale = []
+            for tab, rows in tables.items():
+                previous = self._sheet_rows.get(tab)
+                values = rows
+                if previous is None:
+                    # Unknown length: clear everything below the new table
+                    stale.append(f'{tab}!A{len(rows) + 1}:Z')
+                elif previous > len(rows):
+                    blank = [''] * len(rows[0])
+                    values = rows + [blank] * (previous - len(rows))
+                data.append({'range': f'{tab}!A1', 'values': values})
+            
+            response = _with_backoff(lambda: sheet.values_batch_update(
+                body={'valueInputOption': 'RAW', 'data': data}
+            ))
+            self.last_sync_updated_rows = response.get('totalUpdatedRows', 0)
+            if stale:
+                _with_backoff(lambda: sheet.values_batch_clear(body={'ranges': stale}))
+            self._sheet_rows = {tab: len(rows) for tab, rows in tables.items()}
+            # The full rewrite supersedes queued row updates and moves rows
+            self._mission_rows = {mission_id: i for i, mission_id in enumerate(self.missions, start=2)}
+            with self._pending_lock:
+                self._pending_sheet_updates.clear()
+            logger.info("Data synced to Google Sheets")
             return True
-        except Exception as e:
-            print(f"ERROR syncing to Google Sheets: {e}")
+        except Exception:
+            logger.exception("Could not sync to Google Sheets")
+            self._invalidate_spreadsheet_cache()
             return False
     
-    def _sync_pilots_to_sheets(self, sheet):
-        """Sync pilot data to Google Sheets."""
-        try:
-            ws = sheet.worksheet('Pilots')
-            rows = []
-            for pilot in self.pilots.values():
-                rows.append([
-                    pilot.pilot_id,
-                    pilot.name,
-                    ', '.join(pilot.skills),
-                    ', '.join(pilot.certifications),
-                    pilot.location,
-                    pilot.status,
-                    pilot.current_assignment or '',
-                    pilot.available_from.isoformat() if pilot.available_from else ''
-                ])
-            
-            # Clear and update
-            ws.clear()
-            ws.append_row(['pilot_id', 'name', 'skills', 'certifications', 'location', 'status', 'current_assignment', 'available_from'])
-            ws.append_rows(rows)
-            print("  Pilots synced")
-        except Exception as e:
-            print(f"  ERROR syncing pilots: {e}")
+    def _get_spreadsheet(self):
+        """Return the handle for spreadsheet_id, opening it on first use."""
+        if self._spreadsheet is None:
+            self._spreadsheet = self.sheets_client.open_by_key(self.spreadsheet_id)
+        return self._spreadsheet
     
-    def _sync_drones_to_sheets(self, sheet):
-        """Sync drone data to Google Sheets."""
-        try:
-            ws = sheet.worksheet('Drones')
-            rows = []
-            for drone in self.drones.values():
-                rows.append([
-                    drone.drone_id,
-                    drone.model,
-                    ', '.join(drone.capabilities),
-                    drone.status,
-                    drone.location,
-                    drone.current_assignment or '',
-                    drone.maintenance_due.isoformat() if drone.maintenance_due else ''
-                ])
-            
-            # Clear and update
-            ws.clear()
-            ws.append_row(['drone_id', 'model', 'capabilities', 'status', 'location', 'current_assignment', 'maintenance_due'])
-            ws.append_rows(rows)
-            print("  Drones synced")
-        except Exception as e:
-            print(f"  ERROR syncing drones: {e}")
+    def _invalidate_spreadsheet_cache(self):
+        """Drop the cached handle so the next sync reopens the spreadsheet."""
+        self._spreadsheet = None
     
-    def _sync_missions_to_sheets(self, sheet):
-        """Sync mission data to Google Sheets."""
-        try:
-            ws = sheet.worksheet('Missions')
-            rows = []
-            for mission in self.missions.values():
-                rows.append([
-                    mission.project_id,
-                    mission.client,
-                    mission.location,
-                    ', '.join(mission.required_skills),
-                    ', '.join(mission.required_certs),
-                    mission.start_date.isoformat(),
-                    mission.end_date.isoformat(),
-                    mission.priority,
-                    mission.assigned_pilot or '',
-                    mission.assigned_drone or ''
-                ])
-            
-            # Clear and update
-            ws.clear()
-            ws.append_row(['project_id', 'client', 'location', 'required_skills', 'required_certs', 'start_date', 'end_date', 'priority', 'assigned_pilot', 'assigned_drone'])
-            ws.append_rows(rows)
-            print("  Missions synced")
-        except Exception as e:
-            print(f"  ERROR syncing missions: {e}")
+    def _pilot_sheet_rows(self) -> List[list]:
+        """Build the Pilots sheet contents, header first."""
+        rows = [['pilot_id', 'name', 'skills', 'certifications', 'location', 'status', 'current_assignment', 'available_from']]
+        for pilot in self.pilots.values():
+            rows.append([
+                pilot.pilot_id,
+                pilot.name,
+                join_sorted(pilot.skills),
+                join_sorted(pilot.certifications),
+                pilot.location,
+                pilot.status,
+                pilot.current_assignment or '',
+                pilot.available_from.isoformat() if pilot.available_from else ''
+            ])
+        return rows
+    
+    def _drone_sheet_rows(self) -> List[list]:
+        """Build the Drones sheet contents, header first."""
+        rows = [['drone_id', 'model', 'capabilities', 'status', 'location', 'current_assignment', 'maintenance_due']]
+        for drone in self.drones.values():
+            rows.append([
+                drone.drone_id,
+                drone.model,
+                join_sorted(drone.capabilities),
+                drone.status,
+                drone.location,
+                drone.current_assignment or '',
+                drone.maintenance_due.isoformat() if drone.maintenance_due else ''
+            ])
+        return rows
+    
+    def _mission_sheet_rows(self) -> List[list]:
+        """Build the Missions sheet contents, header first."""
+        rows = [['project_id', 'client', 'location', 'required_skills', 'required_certs', 'start_date', 'end_date', 'priority', 'assigned_pilot', 'assigned_drone']]
+        for mission in self.missions.values():
+            rows.append([
+                mission.project_id,
+                mission.client,
+                mission.location,
+                join_sorted(mission.required_skills),
+                join_sorted(mission.required_certs),
+                mission.start_date.isoformat(),
+                mission.end_date.isoformat(),
+                mission.priority,
+                mission.assigned_pilot or '',
+                mission.assigned_drone or ''
+            ])
+        return rows
     
     def _sync_mission_to_sheets(self, mission_id: str):
-        """Sync single mission update to Google Sheets."""
+        """Queue a mission's assignment for the next batched Sheets write.
+        
+        Changes made within SHEETS_FLUSH_DELAY seconds are written together
+        by flush_pending_updates in one values.batchUpdate call.
+        """
+        mission = self.missions.get(mission_id)
+        if not mission or not self.sheets_client:
+            return
+        
+        with self._pending_lock:
+            self._pending_sheet_updates[mission_id] = [mission.assigned_pilot or '', mission.assigned_drone or '']
+            self._schedule_flush()
+    
+    def _schedule_flush(self):
+        """Start the flush timer unless one is already pending; call with _pending_lock held."""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.SHEETS_FLUSH_DELAY, self.flush_pending_updates)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def flush_pending_updates(self) -> bool:
+        """Write all queued mission assignments to Sheets in a single request."""
+        with self._pending_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            pending = self._pending_sheet_updates
+            self._pending_sheet_updates = {}
+        
+        if not pending:
+            return True
+        
+        # Assigned pilot and drone are columns I and J of the Missions tab
+        data = []
+        for mission_id, values in pending.items():
+            row = self._mission_rows.get(mission_id)
+            if row is None:
+                logger.warning("Mission %s has no row in Sheets; skipping", mission_id)
+                continue
+            data.append({'range': f'Missions!I{row}:J{row}', 'values': [values]})
+        if not data:
+            return True
+        
         try:
-            if not self.sheets_client:
-                return
-            
-            sheet = self.sheets_client.open_by_key(self.spreadsheet_id)
-            ws = sheet.worksheet('Missions')
-            mission = self.missions.get(mission_id)
-            
-            if not mission:
-                return
-            
-            # Find and update the row
-            records = ws.get_all_records()
-            for i, record in enumerate(records, start=2):
-                if record.get('project_id') == mission_id:
-                    ws.update_cell(i, 9, mission.assigned_pilot or '')  # Column I
-                    ws.update_cell(i, 10, mission.assigned_drone or '')  # Column J
-                    print(f"  Updated mission {mission_id} in Sheets")
-                    break
+            sheet = self._get_spreadsheet()
+            _with_backoff(lambda: sheet.values_batch_update(
+                body={'valueInputOption': 'RAW', 'data': data}
+            ))
+            logger.info("Updated %d mission(s) in Sheets", len(data))
+            return True
         except Exception as e:
-            print(f"  WARNING: Could not sync mission {mission_id}: {e}")
+            logger.warning("Could not sync missions %s: %s", ', '.join(pending), e)
+            self._invalidate_spreadsheet_cache()
+            # Keep the changes for a retry unless they were superseded
+            with self._pending_lock:
+                for mission_id, values in pending.items():
+                    self._pending_sheet_updates.setdefault(mission_id, values)
+                self._schedule_flush()
+            return False
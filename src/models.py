@@ -1,15 +1,35 @@
 """Data models for Drone Operations Coordinator."""
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional
 
-@dataclass
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@lru_cache(maxsize=4096)
+def join_sorted(items: FrozenSet[str]) -> str:
+    """Render a skill/certification/capability set as a sorted, comma-separated string.
+    
+    Loaded records share equal sets, so each distinct set is joined once.
+    """
+    return ', '.join(sorted(items))
+
+
+def to_micros(dt: datetime) -> int:
+    """Convert a datetime to integer microseconds for cheap ordering comparisons."""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return (dt - datetime.min) // _MICROSECOND
+
+
+@dataclass(slots=True)
 class Pilot:
     """Pilot data model."""
     pilot_id: str
     name: str
-    skills: List[str]
-    certifications: List[str]
+    skills: FrozenSet[str]
+    certifications: FrozenSet[str]
     location: str
     status: str  # Available, On Leave, Assigned, Unavailable
     current_assignment: Optional[str] = None
@@ -23,21 +43,21 @@ class Pilot:
             return False
         return True
     
-    def has_skills(self, required_skills: List[str]) -> bool:
+    def has_skills(self, required_skills: Iterable[str]) -> bool:
         """Check if pilot has all required skills."""
-        return all(skill in self.skills for skill in required_skills)
+        return self.skills.issuperset(required_skills)
     
-    def has_certifications(self, required_certs: List[str]) -> bool:
+    def has_certifications(self, required_certs: Iterable[str]) -> bool:
         """Check if pilot has all required certifications."""
-        return all(cert in self.certifications for cert in required_certs)
+        return self.certifications.issuperset(required_certs)
 
 
-@dataclass
+@dataclass(slots=True)
 class Drone:
     """Drone data model."""
     drone_id: str
     model: str
-    capabilities: List[str]
+    capabilities: FrozenSet[str]
     status: str  # Available, Maintenance, Deployed
     location: str
     current_assignment: Optional[str] = None
@@ -47,40 +67,84 @@ class Drone:
         """Check if drone is available for assignment."""
         return self.status == "Available"
     
-    def has_capabilities(self, required_capabilities: List[str]) -> bool:
+    def has_capabilities(self, required_capabilities: FrozenSet[str]) -> bool:
         """Check if drone has all required capabilities."""
-        return all(cap in self.capabilities for cap in required_capabilities)
+        return self.capabilities.issuperset(required_capabilities)
     
     def is_in_maintenance(self) -> bool:
         """Check if drone is in maintenance."""
         return self.status == "Maintenance"
 
 
-@dataclass
+@dataclass(slots=True)
 class Mission:
     """Mission/Project data model."""
     project_id: str
     client: str
     location: str
-    required_skills: List[str]
-    required_certs: List[str]
+    required_skills: FrozenSet[str]
+    required_certs: FrozenSet[str]
     start_date: datetime
     end_date: datetime
     priority: str  # High, Urgent, Standard
     assigned_pilot: Optional[str] = None
     assigned_drone: Optional[str] = None
+    # Integer copies of start_date/end_date used by overlap checks
+    start_ts: int = field(init=False, repr=False, compare=False)
+    end_ts: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.start_ts = to_micros(self.start_date)
+        self.end_ts = to_micros(self.end_date)
     
     def is_urgent(self) -> bool:
         """Check if mission is urgent."""
         return self.priority in ["Urgent", "High"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Conflict:
     """Represents a conflict or issue."""
     conflict_type: str  # double-booking, skill-mismatch, equipment-mismatch, location-mismatch, maintenance-conflict
     severity: str  # critical, major, minor
-    description: str
+    # Formatted with description_args only when description is read
+    description_template: str
+    description_args: tuple = ()
     affected_pilot: Optional[str] = None
     affected_drone: Optional[str] = None
     affected_mission: Optional[str] = None
+    # The other mission in a pairwise conflict such as a double-booking
+    related_mission: Optional[str] = None
+    _description: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def description(self) -> str:
+        """Human-readable description; sets in the arguments are listed sorted."""
+        if self._description is None:
+            self._description = self.description_template.format(*(
+                ', '.join(sorted(arg)) if isinstance(arg, (set, frozenset)) else arg
+                for arg in self.description_args
+            ))
+        return self._description
+
+
+@dataclass(slots=True)
+class ConflictReport:
+    """Conflicts from one detector run, indexed by the records they involve."""
+    conflicts: List[Conflict] = field(default_factory=list)
+    by_mission: Dict[str, List[Conflict]] = field(default_factory=dict)
+    by_pilot: Dict[str, List[Conflict]] = field(default_factory=dict)
+    by_drone: Dict[str, List[Conflict]] = field(default_factory=dict)
+    by_severity: Dict[str, List[Conflict]] = field(default_factory=dict)
+    
+    def add(self, conflict: Conflict):
+        """Record a conflict under its severity and every mission, pilot and drone it involves."""
+        self.conflicts.append(conflict)
+        self.by_severity.setdefault(conflict.severity, []).append(conflict)
+        for mission_id in (conflict.affected_mission, conflict.related_mission):
+            if mission_id:
+                self.by_mission.setdefault(mission_id, []).append(conflict)
+        if conflict.affected_pilot:
+            self.by_pilot.setdefault(conflict.affected_pilot, []).append(conflict)
+        if conflict.affected_drone:
+            self.by_drone.setdefault(conflict.affected_drone, []).append(conflict)
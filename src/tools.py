@@ -1,15 +1,87 @@
 """Tools for the Drone Operations Agent."""
 import json
-from typing import Optional, List
-from database import DroneDatabase
-from conflict_detector import ConflictDetector
+from functools import cached_property, lru_cache
+from typing import Dict, Optional, List, Tuple
+from .database import DroneDatabase, _parse_date
+from .conflict_detector import ConflictDetector
+from .models import Conflict, ConflictReport, join_sorted
+
+# Response layouts, filled in with str.format
+_PILOT_ROW = (
+    "{i}. {name} ({pilot_id})\n"
+    "   Skills: {skills}\n"
+    "   Certifications: {certifications}\n"
+    "   Location: {location}\n"
+    "   Status: {status}\n\n"
+)
+_PILOT_DETAILS = (
+    "Pilot Details: {name}\n\n"
+    "ID: {pilot_id}\n"
+    "Location: {location}\n"
+    "Status: {status}\n\n"
+    "Skills: {skills}\n"
+    "Certifications: {certifications}\n\n"
+    "Current Assignment: {assignment}\n"
+    "Available From: {available_from}\n"
+)
+_DRONE_ROW = (
+    "{i}. {model} ({drone_id})\n"
+    "   Capabilities: {capabilities}\n"
+    "   Location: {location}\n"
+    "   Status: {status}\n\n"
+)
+_DRONE_DETAILS = (
+    "Drone Details: {model}\n\n"
+    "ID: {drone_id}\n"
+    "Location: {location}\n"
+    "Status: {status}\n\n"
+    "Capabilities: {capabilities}\n\n"
+    "Current Assignment: {assignment}\n"
+    "Maintenance Due: {maintenance_due}\n"
+)
+_MISSION_ROW = (
+    "{i}. {project_id}\n"
+    "   Client: {client}\n"
+    "   Location: {location}\n"
+    "   Priority: {priority}\n"
+    "   Status: {status}\n\n"
+)
+_MISSION_DETAILS = (
+    "Mission Details: {project_id}\n\n"
+    "Client: {client}\n"
+    "Location: {location}\n"
+    "Priority: {priority}\n\n"
+    "Schedule:\n"
+    "  Start: {start}\n"
+    "  End: {end}\n\n"
+    "Requirements:\n"
+    "  Skills: {skills}\n"
+    "  Certifications: {certifications}\n\n"
+    "Assignments:\n"
+    "  Pilot: {pilot}\n"
+    "  Drone: {drone}\n"
+)
 
 class DroneOperationsTools:
     """Tools available to the agent."""
     
     def __init__(self, db: DroneDatabase):
         self.db = db
-        self.conflict_detector = ConflictDetector(db)
+        # Detector results for one db revision: (revision, full report) and
+        # (revision, {mission_id: conflicts}); any data change invalidates them
+        self._conflict_cache: Optional[Tuple[int, ConflictReport]] = None
+        self._mission_conflict_cache: Tuple[int, Dict[str, List[Conflict]]] = (-1, {})
+        # Rendered texts keyed by (id, db revision); any data change bumps the
+        # revision, so stale entries are never hit again and age out
+        self._pilot_details = lru_cache(maxsize=256)(self._render_pilot_details)
+        self._drone_details = lru_cache(maxsize=256)(self._render_drone_details)
+        self._mission_details = lru_cache(maxsize=256)(self._render_mission_details)
+        self._mission_list = lru_cache(maxsize=1)(self._render_mission_list)
+    
+    @cached_property
+    def conflict_detector(self) -> ConflictDetector:
+        """Conflict detector for db, created on first use."""
+        return ConflictDetector(self.db)
     
     # ===== PILOT TOOLS =====
     def find_available_pilots(self, location: Optional[str] = None, skill: Optional[str] = None) -> str:
@@ -19,42 +91,51 @@ class DroneOperationsTools:
         if not pilots:
             return "No available pilots found matching criteria."
         
-        result = f"Available Pilots ({len(pilots)}):\n\n"
+        parts = [f"Available Pilots ({len(pilots)}):\n\n"]
         for i, pilot in enumerate(pilots, 1):
-            result += f"{i}. {pilot.name} ({pilot.pilot_id})\n"
-            result += f"   Skills: {', '.join(pilot.skills)}\n"
-            result += f"   Certifications: {', '.join(pilot.certifications)}\n"
-            result += f"   Location: {pilot.location}\n"
-            result += f"   Status: {pilot.status}\n\n"
-        
-        return result
+            parts.append(_PILOT_ROW.format(
+                i=i,
+                name=pilot.name,
+                pilot_id=pilot.pilot_id,
+                skills=join_sorted(pilot.skills),
+                certifications=join_sorted(pilot.certifications),
+                location=pilot.location,
+                status=pilot.status
+            ))
+        
+        return "".join(parts)
     
     def get_pilot_details(self, pilot_id: str) -> str:
         """Get detailed information about a specific pilot."""
+        return self._pilot_details(pilot_id, self.db.revision)
+    
+    def _render_pilot_details(self, pilot_id: str, revision: int) -> str:
+        """Render get_pilot_details; `revision` only keys the cache."""
         pilot = self.db.get_pilot_by_id(pilot_id)
         if not pilot:
             return f"Pilot {pilot_id} not found."
         
-        result = f"Pilot Details: {pilot.name}\n\n"
-        result += f"ID: {pilot.pilot_id}\n"
-        result += f"Location: {pilot.location}\n"
-        result += f"Status: {pilot.status}\n\n"
-        result += f"Skills: {', '.join(pilot.skills)}\n"
-        result += f"Certifications: {', '.join(pilot.certifications)}\n\n"
-        result += f"Current Assignment: {pilot.current_assignment or 'None'}\n"
-        result += f"Available From: {pilot.available_from or 'Available now'}\n"
-        return result
+        return _PILOT_DETAILS.format(
+            name=pilot.name,
+            pilot_id=pilot.pilot_id,
+            location=pilot.location,
+            status=pilot.status,
+            skills=join_sorted(pilot.skills),
+            certifications=join_sorted(pilot.certifications),
+            assignment=pilot.current_assignment or 'None',
+            available_from=pilot.available_from or 'Available now'
+        )
     
     def get_pilot_availability(self, pilot_id: str, start_date: str, end_date: str) -> str:
         """Check if a pilot is available for a date range."""
-        from datetime import datetime
         pilot = self.db.get_pilot_by_id(pilot_id)
         if not pilot:
             return f"Pilot {pilot_id} not found."
         
         try:
-            start = datetime.fromisoformat(start_date)
-            end = datetime.fromisoformat(end_date)
+            # Memoized, since the same dates tend to be asked about repeatedly
+            start = _parse_date(start_date)
+            end = _parse_date(end_date)
             is_available = pilot.is_available(start, end)
             return f"Pilot {pilot.name} is {'available' if is_available else 'NOT available'} for {start_date} to {end_date}. Current status: {pilot.status}"
         except ValueError:
@@ -68,67 +149,84 @@ class DroneOperationsTools:
         if not drones:
             return "No available drones found matching criteria."
         
-        result = f"Available Drones ({len(drones)}):\n\n"
+        parts = [f"Available Drones ({len(drones)}):\n\n"]
         for i, drone in enumerate(drones, 1):
-            result += f"{i}. {drone.model} ({drone.drone_id})\n"
-            result += f"   Capabilities: {', '.join(drone.capabilities)}\n"
-            result += f"   Location: {drone.location}\n"
-            result += f"   Status: {drone.status}\n\n"
-        
-        return result
+            parts.append(_DRONE_ROW.format(
+                i=i,
+                model=drone.model,
+                drone_id=drone.drone_id,
+                capabilities=join_sorted(drone.capabilities),
+                location=drone.location,
+                status=drone.status
+            ))
+        
+        return "".join(parts)
     
     def get_drone_details(self, drone_id: str) -> str:
         """Get detailed information about a specific drone."""
+        return self._drone_details(drone_id, self.db.revision)
+    
+    def _render_drone_details(self, drone_id: str, revision: int) -> str:
+        """Render get_drone_details; `revision` only keys the cache."""
         drone = self.db.get_drone_by_id(drone_id)
         if not drone:
             return f"Drone {drone_id} not found."
         
-        result = f"Drone Details: {drone.model}\n\n"
-        result += f"ID: {drone.drone_id}\n"
-        result += f"Location: {drone.location}\n"
-        result += f"Status: {drone.status}\n\n"
-        result += f"Capabilities: {', '.join(drone.capabilities)}\n\n"
-        result += f"Current Assignment: {drone.current_assignment or 'None'}\n"
-        result += f"Maintenance Due: {drone.maintenance_due or 'Not scheduled'}\n"
-        return result
+        return _DRONE_DETAILS.format(
+            model=drone.model,
+            drone_id=drone.drone_id,
+            location=drone.location,
+            status=drone.status,
+            capabilities=join_sorted(drone.capabilities),
+            assignment=drone.current_assignment or 'None',
+            maintenance_due=drone.maintenance_due or 'Not scheduled'
+        )
     
     # ===== MISSION TOOLS =====
     def get_mission_details(self, mission_id: str) -> str:
         """Get details about a mission/project."""
+        return self._mission_details(mission_id, self.db.revision)
+    
+    def _render_mission_details(self, mission_id: str, revision: int) -> str:
+        """Render get_mission_details; `revision` only keys the cache."""
         mission = self.db.get_mission_by_id(mission_id)
         if not mission:
             return f"Mission {mission_id} not found."
         
-        result = f"Mission Details: {mission.project_id}\n\n"
-        result += f"Client: {mission.client}\n"
-        result += f"Location: {mission.location}\n"
-        result += f"Priority: {mission.priority}\n\n"
-        result += f"Schedule:\n"
-        result += f"  Start: {mission.start_date.isoformat()}\n"
-        result += f"  End: {mission.end_date.isoformat()}\n\n"
-        result += f"Requirements:\n"
-        result += f"  Skills: {', '.join(mission.required_skills)}\n"
-        result += f"  Certifications: {', '.join(mission.required_certs)}\n\n"
-        result += f"Assignments:\n"
-        result += f"  Pilot: {mission.assigned_pilot or 'Not assigned'}\n"
-        result += f"  Drone: {mission.assigned_drone or 'Not assigned'}\n"
-        return result
+        return _MISSION_DETAILS.format(
+            project_id=mission.project_id,
+            client=mission.client,
+            location=mission.location,
+            priority=mission.priority,
+            start=mission.start_date.isoformat(),
+            end=mission.end_date.isoformat(),
+            skills=join_sorted(mission.required_skills),
+            certifications=join_sorted(mission.required_certs),
+            pilot=mission.assigned_pilot or 'Not assigned',
+            drone=mission.assigned_drone or 'Not assigned'
+        )
     
     def list_all_missions(self) -> str:
         """List all missions."""
+        return self._mission_list(self.db.revision)
+    
+    def _render_mission_list(self, revision: int) -> str:
+        """Render list_all_missions; `revision` only keys the cache."""
         if not self.db.missions:
             return "No missions found."
         
-        result = f"All Missions ({len(self.db.missions)}):\n\n"
-        for i, (mission_id, mission) in enumerate(self.db.missions.items(), 1):
-            status = "Assigned" if mission.assigned_pilot else "Unassigned"
-            result += f"{i}. {mission.project_id}\n"
-            result += f"   Client: {mission.client}\n"
-            result += f"   Location: {mission.location}\n"
-            result += f"   Priority: {mission.priority}\n"
-            result += f"   Status: {status}\n\n"
-        
-        return result
+        parts = [f"All Missions ({len(self.db.missions)}):\n\n"]
+        for i, mission in enumerate(self.db.missions.values(), 1):
+            parts.append(_MISSION_ROW.format(
+                i=i,
+                project_id=mission.project_id,
+                client=mission.client,
+                location=mission.location,
+                priority=mission.priority,
+                status="Assigned" if mission.assigned_pilot else "Unassigned"
+            ))
+        
+        return "".join(parts)
     
     # ===== ASSIGNMENT TOOLS =====
     def find_best_pilot_for_mission(self, mission_id: str) -> str:
@@ -137,32 +235,24 @@ class DroneOperationsTools:
         if not mission:
             return f"Mission {mission_id} not found."
         
-        candidates = []
-        for pilot in self.db.pilots.values():
-            if pilot.status != "Available":
-                continue
-            if not pilot.has_skills(mission.required_skills):
-                continue
-            if not pilot.has_certifications(mission.required_certs):
-                continue
-            if pilot.location != mission.location:
-                continue
-            
-            candidates.append(pilot)
-        
-        if not candidates:
+        # Return the first available (could add scoring logic here)
+        best_pilot = self.db.find_qualified_pilot(
+            mission.required_skills, mission.required_certs, location=mission.location
+        )
+        
+        if best_pilot is None:
             return f"No suitable pilots available for mission {mission_id}."
         
-        # Return the first available (could add scoring logic here)
-        best_pilot = candidates[0]
-        result = f"Recommended Pilot for {mission_id}:\n\n"
-        result += f"Name: {best_pilot.name} ({best_pilot.pilot_id})\n"
-        result += f"Location: {best_pilot.location}\n"
-        result += f"Skills: {', '.join(best_pilot.skills)}\n"
-        result += f"Certifications: {', '.join(best_pilot.certifications)}\n"
-        result += f"Status: {best_pilot.status}\n\n"
-        result += "Reason: Has all required skills and certifications."
-        return result
+        parts = [
+            f"Recommended Pilot for {mission_id}:\n\n",
+            f"Name: {best_pilot.name} ({best_pilot.pilot_id})\n",
+            f"Location: {best_pilot.location}\n",
+            f"Skills: {join_sorted(best_pilot.skills)}\n",
+            f"Certifications: {join_sorted(best_pilot.certifications)}\n",
+            f"Status: {best_pilot.status}\n\n",
+            "Reason: Has all required skills and certifications."
+        ]
+        return "".join(parts)
     
     def find_best_drone_for_mission(self, mission_id: str) -> str:
         """Find the best available drone for a mission."""
@@ -170,28 +260,21 @@ class DroneOperationsTools:
         if not mission:
             return f"Mission {mission_id} not found."
         
-        candidates = []
-        for drone in self.db.drones.values():
-            if not drone.is_available():
-                continue
-            if not drone.has_capabilities(mission.required_skills):  # Assuming capabilities match skills needed
-                continue
-            if drone.location != mission.location:
-                continue
-            
-            candidates.append(drone)
-        
-        if not candidates:
+        # Assuming capabilities match skills needed
+        best_drone = self.db.find_qualified_drone(mission.required_skills, location=mission.location)
+        
+        if best_drone is None:
             return f"No suitable drones available for mission {mission_id}."
         
-        best_drone = candidates[0]
-        result = f"Recommended Drone for {mission_id}:\n\n"
-        result += f"Model: {best_drone.model} ({best_drone.drone_id})\n"
-        result += f"Location: {best_drone.location}\n"
-        result += f"Capabilities: {', '.join(best_drone.capabilities)}\n"
-        result += f"Status: {best_drone.status}\n\n"
-        result += "Reason: Has all required capabilities."
-        return result
+        parts = [
+            f"Recommended Drone for {mission_id}:\n\n",
+            f"Model: {best_drone.model} ({best_drone.drone_id})\n",
+            f"Location: {best_drone.location}\n",
+            f"Capabilities: {join_sorted(best_drone.capabilities)}\n",
+            f"Status: {best_drone.status}\n\n",
+            "Reason: Has all required capabilities."
+        ]
+        return "".join(parts)
     
     def assign_pilot_to_mission(self, pilot_id: str, mission_id: str) -> str:
         """Assign a pilot to a mission."""
@@ -208,25 +291,27 @@ class DroneOperationsTools:
             return f"Pilot {pilot.name} is not available (status: {pilot.status})."
         
         if not pilot.has_skills(mission.required_skills):
-            missing = [s for s in mission.required_skills if s not in pilot.skills]
-            return f"Pilot {pilot.name} lacks required skills: {', '.join(missing)}"
+            missing = mission.required_skills - pilot.skills
+            return f"Pilot {pilot.name} lacks required skills: {', '.join(sorted(missing))}"
         
         if not pilot.has_certifications(mission.required_certs):
-            missing = [c for c in mission.required_certs if c not in pilot.certifications]
-            return f"Pilot {pilot.name} lacks required certifications: {', '.join(missing)}"
+            missing = mission.required_certs - pilot.certifications
+            return f"Pilot {pilot.name} lacks required certifications: {', '.join(sorted(missing))}"
         
         # Perform assignment
         self.db.update_pilot_status(pilot_id, "Assigned", mission_id)
         self.db.update_mission_assignment(mission_id, pilot_id, mission.assigned_drone)
         
-        result = f"Assignment Successful\n\n"
-        result += f"Pilot: {pilot.name} ({pilot_id})\n"
-        result += f"Mission: {mission_id}\n\n"
-        result += f"Assignment Details:\n"
-        result += f"  Status: Assigned\n"
-        result += f"  Start: {mission.start_date.isoformat()}\n"
-        result += f"  End: {mission.end_date.isoformat()}\n"
-        return result
+        parts = [
+            f"Assignment Successful\n\n",
+            f"Pilot: {pilot.name} ({pilot_id})\n",
+            f"Mission: {mission_id}\n\n",
+            f"Assignment Details:\n",
+            f"  Status: Assigned\n",
+            f"  Start: {mission.start_date.isoformat()}\n",
+            f"  End: {mission.end_date.isoformat()}\n"
+        ]
+        return "".join(parts)
     
     def assign_drone_to_mission(self, drone_id: str, mission_id: str) -> str:
         """Assign a drone to a mission."""
@@ -244,48 +329,47 @@ class DroneOperationsTools:
         self.db.update_drone_status(drone_id, "Deployed", mission_id)
         self.db.update_mission_assignment(mission_id, mission.assigned_pilot, drone_id)
         
-        result = f"Assignment Successful\n\n"
-        result += f"Drone: {drone.model} ({drone_id})\n"
-        result += f"Mission: {mission_id}\n\n"
-        result += f"Assignment Details:\n"
-        result += f"  Status: Deployed\n"
-        result += f"  Start: {mission.start_date.isoformat()}\n"
-        result += f"  End: {mission.end_date.isoformat()}\n"
-        return result
+        parts = [
+            f"Assignment Successful\n\n",
+            f"Drone: {drone.model} ({drone_id})\n",
+            f"Mission: {mission_id}\n\n",
+            f"Assignment Details:\n",
+            f"  Status: Deployed\n",
+            f"  Start: {mission.start_date.isoformat()}\n",
+            f"  End: {mission.end_date.isoformat()}\n"
+        ]
+        return "".join(parts)
     
     # ===== CONFLICT DETECTION TOOLS =====
     def detect_conflicts(self) -> str:
         """Detect and report all conflicts."""
-        conflicts = self.conflict_detector.detect_all_conflicts()
+        report = self._conflict_report()
         
-        if not conflicts:
+        if not report.conflicts:
             return "No conflicts detected. All assignments are valid!"
         
-        result = f"Conflicts Detected ({len(conflicts)} total):\n\n"
+        parts = [f"Conflicts Detected ({len(report.conflicts)} total):\n\n"]
         
-        # Group by severity
-        critical = [c for c in conflicts if c.severity == "critical"]
-        major = [c for c in conflicts if c.severity == "major"]
-        minor = [c for c in conflicts if c.severity == "minor"]
+        # Already grouped by severity by the detector
+        critical = report.by_severity.get("critical", [])
+        major = report.by_severity.get("major", [])
+        minor = report.by_severity.get("minor", [])
         
         if critical:
-            result += "CRITICAL ISSUES:  \n"
-            for i, c in enumerate(critical, 1):
-                result += f"  {i}. {c.description}\n"
-            result += "\n"
+            parts.append("CRITICAL ISSUES:  \n")
+            parts.extend(f"  {i}. {c.description}\n" for i, c in enumerate(critical, 1))
+            parts.append("\n")
         
         if major:
-            result += "MAJOR ISSUES:\n"
-            for i, c in enumerate(major, 1):
-                result += f"  {i}. {c.description}\n"
-            result += "\n"
+            parts.append("MAJOR ISSUES:\n")
+            parts.extend(f"  {i}. {c.description}\n" for i, c in enumerate(major, 1))
+            parts.append("\n")
         
         if minor:
-            result += "MINOR ISSUES:\n"
-            for i, c in enumerate(minor, 1):
-                result += f"  {i}. {c.description}\n"
+            parts.append("MINOR ISSUES:\n")
+            parts.extend(f"  {i}. {c.description}\n" for i, c in enumerate(minor, 1))
         
-        return result
+        return "".join(parts)
     
     def check_mission_conflicts(self, mission_id: str) -> str:
         """Check for conflicts specific to a mission."""
@@ -293,18 +377,37 @@ class DroneOperationsTools:
         if not mission:
             return f"Mission {mission_id} not found."
         
-        conflicts = self.conflict_detector.detect_all_conflicts()
-        mission_conflicts = [c for c in conflicts if c.affected_mission == mission_id]
+        mission_conflicts = self._mission_conflicts(mission_id)
         
         if not mission_conflicts:
             return f"No conflicts for mission {mission_id}."
         
-        result = f"Conflicts for {mission_id}:\n\n"
+        parts = [f"Conflicts for {mission_id}:\n\n"]
         for i, c in enumerate(mission_conflicts, 1):
             severity_label = c.severity.upper()
-            result += f"{i}. [{severity_label}] {c.description}\n"
+            parts.append(f"{i}. [{severity_label}] {c.description}\n")
         
-        return result
+        return "".join(parts)
+    
+    def _conflict_report(self) -> ConflictReport:
+        """Run the full conflict scan, reusing the result until the data changes."""
+        revision = self.db.revision
+        cached = self._conflict_cache
+        if cached and cached[0] == revision:
+            return cached[1]
+        report = self.conflict_detector.detect_all_conflicts()
+        self._conflict_cache = (revision, report)
+        return report
+    
+    def _mission_conflicts(self, mission_id: str) -> List[Conflict]:
+        """Check one mission, reusing the result until the data changes."""
+        revision = self.db.revision
+        if self._mission_conflict_cache[0] != revision:
+            self._mission_conflict_cache = (revision, {})
+        by_mission = self._mission_conflict_cache[1]
+        if mission_id not in by_mission:
+            by_mission[mission_id] = self.conflict_detector.detect_mission_conflicts(mission_id)
+        return by_mission[mission_id]
     
     # ===== REASSIGNMENT TOOLS =====
     def find_alternative_pilot(self, current_pilot_id: str, mission_id: str) -> str:
@@ -313,89 +416,86 @@ class DroneOperationsTools:
         if not mission:
             return f"Mission {mission_id} not found."
         
-        alternatives = []
-        for pilot in self.db.pilots.values():
-            if pilot.pilot_id == current_pilot_id:
-                continue
-            if pilot.status != "Available":
-                continue
-            if not pilot.has_skills(mission.required_skills):
-                continue
-            if not pilot.has_certifications(mission.required_certs):
-                continue
-            # Location flexibility for urgent reassignments
-            alternatives.append(pilot)
+        # Location flexibility for urgent reassignments
+        alternatives = [
+            pilot for pilot in self.db.get_qualified_pilots(mission.required_skills, mission.required_certs)
+            if pilot.pilot_id != current_pilot_id
+        ]
         
         if not alternatives:
             return f"No alternative pilots available for mission {mission_id}."
         
-        result = f"Alternative Pilots for {mission_id}:\n\n"
+        parts = [f"Alternative Pilots for {mission_id}:\n\n"]
         for i, pilot in enumerate(alternatives, 1):
             location_note = "(Same location)" if pilot.location == mission.location else "(Different location)"
-            result += f"{i}. {pilot.name} ({pilot.pilot_id})\n"
-            result += f"   Location: {pilot.location} {location_note}\n"
-            result += f"   Status: {pilot.status}\n\n"
+            parts.append(
+                f"{i}. {pilot.name} ({pilot.pilot_id})\n"
+                f"   Location: {pilot.location} {location_note}\n"
+                f"   Status: {pilot.status}\n\n"
+            )
         
-        return result
+        return "".join(parts)
 
     # ===== SYSTEM STATUS TOOLS =====
     def get_system_status(self) -> str:
         """Get overall system status and statistics."""
-        # Pilot statistics
+        # Pilot statistics (status tallies are maintained by the database)
+        pilot_counts = self.db.counts['pilots']
         total_pilots = len(self.db.pilots)
-        available_pilots = len(self.db.get_available_pilots())
-        assigned_pilots = sum(1 for p in self.db.pilots.values() if p.status == "Assigned")
+        available_pilots = pilot_counts['Available']
+        assigned_pilots = pilot_counts['Assigned']
         unavailable_pilots = total_pilots - available_pilots - assigned_pilots
         
         # Drone statistics
+        drone_counts = self.db.counts['drones']
         total_drones = len(self.db.drones)
-        available_drones = len(self.db.get_available_drones())
-        deployed_drones = sum(1 for d in self.db.drones.values() if d.status == "Deployed")
-        maintenance_drones = sum(1 for d in self.db.drones.values() if d.status == "Maintenance")
+        available_drones = drone_counts['Available']
+        deployed_drones = drone_counts['Deployed']
+        maintenance_drones = drone_counts['Maintenance']
         
         # Mission statistics
         total_missions = len(self.db.missions)
-        assigned_missions = sum(1 for m in self.db.missions.values() if m.assigned_pilot)
+        assigned_missions = self.db.counts['missions_assigned']
         unassigned_missions = total_missions - assigned_missions
         
-        # Conflicts
-        conflicts = self.conflict_detector.detect_all_conflicts()
-        critical_conflicts = len([c for c in conflicts if c.severity == "critical"])
-        major_conflicts = len([c for c in conflicts if c.severity == "major"])
-        minor_conflicts = len([c for c in conflicts if c.severity == "minor"])
+        # Conflicts, already grouped by severity by the detector
+        by_severity = self._conflict_report().by_severity
+        critical_conflicts = len(by_severity.get('critical', ()))
+        major_conflicts = len(by_severity.get('major', ()))
+        minor_conflicts = len(by_severity.get('minor', ()))
         
         # Calculate percentages
         pilots_available_pct = round((available_pilots / total_pilots * 100) if total_pilots > 0 else 0)
         drones_available_pct = round((available_drones / total_drones * 100) if total_drones > 0 else 0)
         missions_assigned_pct = round((assigned_missions / total_missions * 100) if total_missions > 0 else 0)
         
-        result = "\n"
-        result += "SYSTEM STATUS REPORT\n\n"
-        
-        result += "PILOTS\n"
-        result += f"  Total:       {total_pilots}\n"
-        result += f"  Available:   {available_pilots} ({pilots_available_pct}%)\n"
-        result += f"  Assigned:    {assigned_pilots}\n"
-        result += f"  Unavailable: {unavailable_pilots}\n\n"
-        
-        result += "DRONES\n"
-        result += f"  Total:       {total_drones}\n"
-        result += f"  Available:   {available_drones} ({drones_available_pct}%)\n"
-        result += f"  Deployed:    {deployed_drones}\n"
-        result += f"  Maintenance: {maintenance_drones}\n\n"
-        
-        result += "MISSIONS\n"
-        result += f"  Total:       {total_missions}\n"
-        result += f"  Assigned:    {assigned_missions} ({missions_assigned_pct}%)\n"
-        result += f"  Unassigned:  {unassigned_missions}\n\n"
-        
-        result += "CONFLICTS\n"
-        result += f"  Critical:    {critical_conflicts}\n"
-        result += f"  Major:       {major_conflicts}\n"
-        result += f"  Minor:       {minor_conflicts}\n"
+        parts = [
+            "\n",
+            "SYSTEM STATUS REPORT\n\n",
+            "PILOTS\n",
+            f"  Total:       {total_pilots}\n",
+            f"  Available:   {available_pilots} ({pilots_available_pct}%)\n",
+            f"  Assigned:    {assigned_pilots}\n",
+            f"  Unavailable: {unavailable_pilots}\n\n",
+            "DRONES\n",
+            f"  Total:       {total_drones}\n",
+            f"  Available:   {available_drones} ({drones_available_pct}%)\n",
+            f"  Deployed:    {deployed_drones}\n",
+            f"  Maintenance: {maintenance_drones}\n\n",
+            "MISSIONS\n",
+            f"  Total:       {total_missions}\n",
+            f"  Assigned:    {assigned_missions} ({missions_assigned_pct}%)\n",
+            f"  Unassigned:  {unassigned_missions}\n\n",
+            "CONFLICTS\n",
+            f"  Critical:    {critical_conflicts}\n",
+            f"  Major:       {major_conflicts}\n",
+            f"  Minor:       {minor_conflicts}\n"
+        ]
         
         if critical_conflicts > 0:
-            result += f"\n  WARNING: {critical_conflicts} critical conflict(s) require attention!\n"
-            result += "  Use 'Detect conflicts' for details.\n"
+            parts.append(
+                f"\n  WARNING: {critical_conflicts} critical conflict(s) require attention!\n"
+                "  Use 'Detect conflicts' for details.\n"
+            )
         
-        return result
+        return "".join(parts)
@@ -1,13 +1,6 @@
 #!/usr/bin/env python
 """Test script for system status feature."""
-import sys
-import os
-from pathlib import Path
-
-# Setup path
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
-
-from agent import DroneOperationsAgent
+from src.agent import DroneOperationsAgent
 
 # Initialize agent
 print("Initializing agent...")
@@ -0,0 +1,67 @@
+"""Checks the double-booking sweep in ConflictDetector."""
+import unittest
+from datetime import datetime
+
+from src.conflict_detector import ConflictDetector
+from src.database import DroneDatabase
+from src.models import Drone, Mission, Pilot
+
+
+def _mission(project_id: str, start_day: int, end_day: int) -> Mission:
+    return Mission(
+        project_id=project_id,
+        client="Client",
+        location="Bangalore",
+        required_skills=frozenset(),
+        required_certs=frozenset(),
+        start_date=datetime(2026, 2, start_day),
+        end_date=datetime(2026, 2, end_day),
+        priority="Standard",
+        assigned_pilot="P001",
+        assigned_drone="D001",
+    )
+
+
+def _pairs(conflicts, resource_field: str) -> set:
+    """The mission pairs double-booked on a resource, as order-free keys."""
+    return {
+        frozenset((c.affected_mission, c.related_mission))
+        for c in conflicts
+        if c.conflict_type == "double-booking" and getattr(c, resource_field)
+    }
+
+
+class DoubleBookingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.db = DroneDatabase()
+        self.db.pilots = {"P001": Pilot("P001", "Arjun", frozenset(), frozenset(), "Bangalore", "Assigned")}
+        self.db.drones = {"D001": Drone("D001", "DJI M300", frozenset(), "Deployed", "Bangalore")}
+        # A and B overlap, C starts the day B ends, D is on its own
+        self.db.missions = {m.project_id: m for m in (
+            _mission("PRJA", 1, 5),
+            _mission("PRJB", 3, 7),
+            _mission("PRJC", 7, 9),
+            _mission("PRJD", 20, 22),
+        )}
+        self.db._recount()
+        self.detector = ConflictDetector(self.db)
+
+    def test_only_overlapping_missions_are_reported_once(self):
+        conflicts = self.detector.detect_all_conflicts().conflicts
+        expected = {frozenset(("PRJA", "PRJB"))}
+        self.assertEqual(_pairs(conflicts, "affected_pilot"), expected)
+        self.assertEqual(_pairs(conflicts, "affected_drone"), expected)
+        self.assertEqual(sum(c.conflict_type == "double-booking" for c in conflicts), 2)
+
+    def test_mission_conflicts_agree_with_full_report(self):
+        conflicts = self.detector.detect_all_conflicts().conflicts
+        for mission_id in self.db.missions:
+            involved = [c for c in conflicts if mission_id in (c.affected_mission, c.related_mission)]
+            single = self.detector.detect_mission_conflicts(mission_id)
+            for resource_field in ("affected_pilot", "affected_drone"):
+                self.assertEqual(_pairs(single, resource_field), _pairs(involved, resource_field), mission_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
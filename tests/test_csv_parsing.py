@@ -0,0 +1,56 @@
+"""Checks that the parallel CSV parser matches the sequential one."""
+import mmap
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src import database
+from src.database import _PILOT_COLUMNS, _csv_segment_bounds, _parse_csv_segment, _read_csv_rows
+
+
+HEADER = 'pilot_id,name,skills,certifications,location,status,current_assignment,available_from\n'
+
+
+def _pilot_row(i: int) -> str:
+    """A pilot row; every third one has quoted fields spanning several lines."""
+    if i % 3 == 0:
+        return (f'P{i:04d},"Pilot ""{i}""\nsecond line","Mapping,\nSurvey",DGCA,'
+                f'Bangalore,Available,,2026-02-{i % 28 + 1:02d}\n')
+    return f'P{i:04d},Pilot {i},Inspection,DGCA,Mumbai,Available,,2026-02-{i % 28 + 1:02d}\n'
+
+
+class CsvParsingTest(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(HEADER)
+            f.writelines(_pilot_row(i) for i in range(300))
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_parallel_matches_sequential(self):
+        sequential = list(_read_csv_rows(self.path, _PILOT_COLUMNS, workers=1))
+        with mock.patch.object(database, 'PARALLEL_CSV_BYTES', 0):
+            parallel = list(_read_csv_rows(self.path, _PILOT_COLUMNS, workers=4))
+        self.assertEqual(len(sequential), 300)
+        self.assertEqual(parallel, sequential)
+        self.assertEqual(sequential[0][1], 'Pilot "0"\nsecond line')
+
+    def test_segments_never_split_quoted_fields(self):
+        expected = list(_read_csv_rows(self.path, _PILOT_COLUMNS, workers=1))
+        indexes = list(range(len(_PILOT_COLUMNS)))
+        with open(self.path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            header_end = mm.find(b'\n') + 1
+            for segments in range(1, 40):
+                bounds = _csv_segment_bounds(mm, header_end, segments)
+                rows = []
+                for start, end in zip(bounds, bounds[1:]):
+                    rows.extend(_parse_csv_segment(self.path, start, end, indexes))
+                self.assertEqual(rows, expected, f"{segments} segments")
+
+
+if __name__ == '__main__':
+    unittest.main()
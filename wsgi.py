@@ -0,0 +1,10 @@
+"""WSGI entrypoint for production servers.
+
+Run one threaded gunicorn worker so concurrent /api/chat requests overlap
+while each one waits on the LLM. Keep it to a single process: the agent holds
+the database, conversation history and response cache in memory, and separate
+workers would each have their own copy.
+
+    gunicorn -w 1 -k gthread --threads 8 -b 0.0.0.0:5000 wsgi:app
+"""
+from app import app